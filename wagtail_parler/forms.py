@@ -2,34 +2,107 @@
 from __future__ import annotations
 
 # Standard libs
+from collections import OrderedDict
 from copy import deepcopy
 import re
+from threading import Lock
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Any
+    from typing import Callable
     from typing import Dict
-    from typing import Generator
     from typing import List
     from typing import Optional
     from typing import Set
     from typing import Tuple
 
     from django.db.models import Model
+    from django.http import QueryDict
 
     from parler.model import TranslatedFieldsModel
 
 # Django imports
 from django.conf import settings
 from django.db import transaction
+from django.forms import CharField
+from django.forms import Field
 from django.forms import Form
 from django.forms.models import fields_for_model
+from django.utils.functional import cached_property
+from django.utils.text import format_lazy
 
 # Third Party
+from parler.cache import MISSING
+from parler.cache import is_missing
+from parler.utils import get_language_settings
 from wagtail.admin.forms import WagtailAdminModelForm
 from wagtail.admin.rich_text.editors.draftail import DraftailRichTextArea
+from wagtail.blocks.base import BlockField
 
 from .models import TO_DELETE
+from .models import bulk_save_translations
+from .models import can_bulk_save_translations
+from .models import load_translations
+
+# default content of an empty Draftail rich text
+EMPTY_RICH_TEXT_RE = re.compile(r'^<p data-block-key="[^"]*"></p>$')
+
+
+def is_empty_value(value: Any) -> bool:
+    return not value
+
+
+def is_empty_text(value: Any) -> bool:
+    return not value or not str(value).strip()
+
+
+def is_empty_rich_text(value: Any) -> bool:
+    return is_empty_text(value) or bool(EMPTY_RICH_TEXT_RE.search(value))
+
+
+def is_empty_stream(value: Any) -> bool:
+    return not value or not len(value)
+
+
+# emptiness detectors of cleaned values by widget or form field class
+EMPTINESS_DETECTORS: Dict[type, Callable[[Any], bool]] = {}
+
+
+def register_emptiness_detector(klass: type, detector: Callable[[Any], bool]) -> None:
+    """
+    Register `detector(cleaned_value) -> bool` telling if values of translated fields whose
+    widget or form field is a `klass` (or a subclass) are empty.
+    A translation whose values are all empty is deleted. Detectors are resolved when form classes
+    are built: register yours when your app is ready.
+    """
+    EMPTINESS_DETECTORS[klass] = detector
+
+
+register_emptiness_detector(CharField, is_empty_text)
+register_emptiness_detector(DraftailRichTextArea, is_empty_rich_text)
+register_emptiness_detector(BlockField, is_empty_stream)
+
+
+def get_emptiness_detector(field: Field) -> Callable[[Any], bool]:
+    """
+    Return the emptiness detector of `field` values: the one of its widget, else the one of
+    the field, else `is_empty_value`
+    """
+    for klass in (*type(field.widget).__mro__, *type(field).__mro__):
+        if klass in EMPTINESS_DETECTORS:
+            return EMPTINESS_DETECTORS[klass]
+    return is_empty_value
+
+
+# name of the inputs listing the locales whose tab was never loaded (lazy tabs)
+UNLOADED_LOCALES_FIELD_NAME = "wagtail_parler_unloaded_locales"
+# name of the inputs / query parameters listing the locales picked by the editor
+PICKED_LOCALES_FIELD_NAME = "wagtail_parler_locales"
+# name of the inputs listing the locales whose fields are sent (partial submission)
+SENT_LOCALES_FIELD_NAME = "wagtail_parler_sent_locales"
+# name of the input of the locale tab currently edited (the previewed locale)
+LOCALE_TAB_FIELD_NAME = "wagtail_parler_locale_tab"
 
 
 class AutoParlerModelForm(Form):
@@ -39,48 +112,185 @@ class AutoParlerModelForm(Form):
 
     # pylint: disable=no-member
     auto_parler_fields: Set[str] = set()
+    # [(field_name, i18n_field_name)] by locale, built once with the form class
+    parler_fieldnames_by_locale: Dict[str, List[Tuple[str, str]]] = {}
+    # emptiness detectors by translated field name, resolved once with the form class
+    parler_emptiness_detectors: Dict[str, Callable[[Any], bool]] = {}
     cleaned_data_for_locales: Dict[str, Any] = {}
+    # {locale: {field_name: value}} of existing translations when the form was built
+    initial_data_for_locales: Dict[str, Dict[str, Any]] = {}
+    edited_locales: List[str] = []
+    # locales with fields in this form class
+    parler_locales: List[str] = []
+    # locales the user may edit (None: all)
+    parler_editable_locales: Optional[List[str]] = None
+    # whether tabs of the locales may be loaded on demand (see `TranslationsList`)
+    parler_lazy_tabs = True
+    # number of subclasses for locales subsets kept by form class (see `_get_locales_form_class`)
+    parler_locales_form_classes_size = 16
+    _locales_form_classes: OrderedDict
+    _locales_form_classes_lock = Lock()
 
     def __init__(self, *args: Tuple, **kwargs: Dict) -> None:
         kwargs.setdefault("initial", {})
         self._init_i18n_initials(kwargs.get("instance"), kwargs["initial"])
         self.for_user = kwargs.get("for_user", getattr(self, "for_user", None))
         super().__init__(*args, **kwargs)
-        # All fields of others locales than the default one must NOT be required
-        for conf in settings.PARLER_LANGUAGES[None][1:]:
-            for _fieldname, i18n_fieldname in self.get_localized_fieldnames(conf["code"]):
-                self.fields[i18n_fieldname].required = False  # type: ignore
-                self.fields[i18n_fieldname].label += " (%s)" % conf["code"].upper()  # type: ignore
+        default_locale = settings.PARLER_LANGUAGES[None][0]["code"]
+        # Locales whose tab was never loaded or is unchanged are not sent: they must be left
+        # untouched
+        unsent_locales = self._get_unsent_locales()
+        self.edited_locales = []
+        for locale in self.parler_locales:
+            if locale != default_locale and locale in unsent_locales:
+                for _fieldname, i18n_fieldname in self.get_localized_fieldnames(locale):
+                    self.fields.pop(i18n_fieldname, None)  # type: ignore
+            else:
+                self.edited_locales.append(locale)
+
+    @classmethod
+    def for_locales(cls, locales: List[str]) -> type:
+        """
+        Return a subclass of this form with fields of `locales` only (the default locale is always
+        kept). Translations of others locales are left untouched on save.
+        Subclasses are cached (see `_get_locales_form_class`).
+        """
+        default_locale = settings.PARLER_LANGUAGES[None][0]["code"]
+        subset = [
+            locale
+            for locale in cls.parler_locales
+            if locale == default_locale or locale in locales
+        ]
+        return cls._get_locales_form_class(subset)
+
+    @classmethod
+    def for_preview(cls, data: QueryDict) -> type:
+        """
+        Return a subclass of this form with fields of the previewed locale (the edited tab sent
+        in `data`) and its fallbacks only: others locales are neither validated nor built.
+        """
+        locale = data.get(LOCALE_TAB_FIELD_NAME)
+        if locale not in cls.parler_locales:
+            return cls
+        lang_dict = get_language_settings(locale)
+        previewed = [locale, lang_dict["code"], *lang_dict["fallbacks"]]
+        return cls._get_locales_form_class(
+            [code for code in cls.parler_locales if code in previewed]
+        )
+
+    @classmethod
+    def for_user_locales(cls, locales: List[str]) -> type:
+        """
+        Return a subclass of this form with fields of `locales` only: the locales the user may
+        edit. Translations of others locales are left untouched on save.
+        """
+        subset = [locale for locale in cls.parler_locales if locale in locales]
+        return cls._get_locales_form_class(subset, parler_editable_locales=subset)
+
+    @classmethod
+    def _get_locales_form_class(cls, subset: List[str], **attrs: Any) -> type:
+        """
+        Return the subclass of this form with fields of `subset` locales only (some of
+        `parler_locales`, in the same order) and `attrs`.
+        Subclasses are cached by form class: the `parler_locales_form_classes_size` last used are
+        kept (subsets come from requests: up to 2^N of them for N locales).
+        """
+        if subset == cls.parler_locales and not attrs:
+            return cls
+        key = (tuple(subset), tuple(sorted(attrs)))
+        with cls._locales_form_classes_lock:
+            if "_locales_form_classes" not in cls.__dict__:
+                cls._locales_form_classes = OrderedDict()
+            form_class = cls._locales_form_classes.get(key)
+            if form_class is not None:
+                cls._locales_form_classes.move_to_end(key)
+                return form_class
+        removed_fields: Set[str] = set()
+        for locale in cls.parler_locales:
+            if locale not in subset:
+                removed_fields.update(dict(cls.get_localized_fieldnames(locale)).values())
+        # declared fields set to None are removed from subclasses
+        attrs.update(dict.fromkeys(removed_fields))
+        attrs["parler_locales"] = subset
+        meta_fields = getattr(cls.Meta, "fields", None)  # type: ignore
+        if isinstance(meta_fields, (list, tuple)):
+            attrs["Meta"] = type(
+                "Meta",
+                (cls.Meta,),  # type: ignore
+                {"fields": [f for f in meta_fields if f not in removed_fields]},
+            )
+        form_class = type(cls.__name__, (cls,), attrs)
+        with cls._locales_form_classes_lock:
+            cls._locales_form_classes[key] = form_class
+            while len(cls._locales_form_classes) > cls.parler_locales_form_classes_size:
+                cls._locales_form_classes.popitem(last=False)
+        return form_class
+
+    def keep_current_translations(self, current: Model) -> None:
+        """
+        Replace translations of the instance in locales not edited with this form by the ones of
+        `current`, ex: when the instance is built from a reverted revision, translations of
+        locales the user may not edit (or did not pick) must be left as they currently are.
+        """
+        untouched = [
+            conf["code"]
+            for conf in settings.PARLER_LANGUAGES[None]
+            if conf["code"] not in self.edited_locales
+        ]
+        if not untouched:
+            return
+        i18n_model = current._parler_meta.root_model
+        # current translations (unsaved ones and translations to delete of drafts included)
+        load_translations(current)
+        current_cache = current._translations_cache[i18n_model]
+        locale_cache = self.instance._translations_cache[i18n_model]  # type: ignore
+        for locale in untouched:
+            locale_cache[locale] = current_cache.get(locale, MISSING)
+
+    def _get_data_list(self, name: str) -> List[str]:
+        if hasattr(self.data, "getlist"):  # type: ignore
+            return self.data.getlist(name)  # type: ignore
+        values = self.data.get(name, ())  # type: ignore
+        if isinstance(values, str):
+            values = [values]
+        return list(values)
+
+    def _get_unsent_locales(self) -> Set[str]:
+        """
+        Locales whose fields are not in sent data: tabs never loaded (lazy tabs) or not listed
+        in the sent locales (partial submission of changed tabs only)
+        """
+        if not self.is_bound:  # type: ignore
+            return set()
+        unsent_locales = set(self._get_data_list(UNLOADED_LOCALES_FIELD_NAME))
+        if SENT_LOCALES_FIELD_NAME in self.data:  # type: ignore
+            sent_locales = self._get_data_list(SENT_LOCALES_FIELD_NAME)
+            unsent_locales.update(set(self.parler_locales) - set(sent_locales))
+        return unsent_locales
 
     def _init_i18n_initials(self, instance: Model, initials: Dict) -> Optional[Dict]:
         """
         If instance already has translations, populates the initial content of translated fields
         """
+        self.initial_data_for_locales = {}
         if not instance or not instance.pk:
             return None
-        i18n_meta = instance._parler_meta.root
-        i18n_model = i18n_meta.model
-        for language_code in instance.get_available_languages(include_unsaved=True):
-            try:
-                translation = instance.get_translation(language_code)
-            except i18n_model.DoesNotExist:
-                pass
-            else:
-                for field_name, i18n_field_name in self.get_localized_fieldnames(language_code):
-                    if hasattr(translation, field_name):
-                        initials[i18n_field_name] = getattr(translation, field_name)
+        for language_code, translation in load_translations(instance).items():
+            data = self.initial_data_for_locales[language_code] = {}
+            for field_name, i18n_field_name in self.get_localized_fieldnames(language_code):
+                if hasattr(translation, field_name):
+                    data[field_name] = initials[i18n_field_name] = getattr(translation, field_name)
         return initials
 
-    def get_localized_fieldnames(self, locale: str) -> Generator:
+    @classmethod
+    def get_localized_fieldnames(cls, locale: str) -> List[Tuple[str, str]]:
         """
-        Generator of (field_name: str, i18n_field_name:str) to get real field_name for
+        List of (field_name: str, i18n_field_name:str) to get real field_name for
         the translated model and the current form associated field name.
 
         param: locale: str: locale code of translation to save/create/delete
         """
-        for field_name in self.auto_parler_fields:
-            i18n_field_name = "translations_%s_%s" % (locale, field_name)
-            yield (field_name, i18n_field_name)
+        return cls.parler_fieldnames_by_locale.get(locale, [])
 
     def _set_locale(self, locale: str) -> List:
         """
@@ -97,12 +307,11 @@ class AutoParlerModelForm(Form):
         i18n_model = i18n_meta.model
         locale_cache = obj._translations_cache[i18n_model]
         locale_cache.pop(locale, None)
-        data = self.cleaned_data_for_locales.get(locale)
         ret: List[TranslatedFieldsModel] = []
-        if not data or all(not d for d in data.values()):
+        if self.is_locale_empty(locale):
             locale_cache[locale] = TO_DELETE
             return ret
-        for t in obj._set_translated_fields(locale, **data):
+        for t in obj._set_translated_fields(locale, **self.cleaned_data_for_locales[locale]):
             obj._translations_cache[t._meta.model][locale] = t
             ret.append(t)
         return ret
@@ -125,35 +334,107 @@ class AutoParlerModelForm(Form):
         # We need to empty cache to force deletion / add etc. because _set_locale could have
         # update the locale_cache for preview process.
         trans_exists = obj.has_translation(locale)
-        data = self.cleaned_data_for_locales.get(locale)
-        if not data or all(not d for d in data.values()):
+        if self.is_locale_empty(locale):
             return None, obj.delete_translation(locale) if trans_exists else 0
         return (
             not trans_exists,
             [
                 obj.save_translation(t)
                 for t in obj._set_translated_fields(  # pylint: disable=protected-access
-                    locale, **data
+                    locale, **self.cleaned_data_for_locales[locale]
                 )
             ],
         )
 
+    def is_locale_empty(self, locale: str) -> bool:
+        """
+        Whether all cleaned values of `locale` are empty: its translation must be deleted
+        """
+        data = self.cleaned_data_for_locales.get(locale)
+        if not data:
+            return True
+        detectors = self.parler_emptiness_detectors
+        return all(
+            detectors.get(field_name, is_empty_value)(value) for field_name, value in data.items()
+        )
+
+    @cached_property
+    def changed_locales(self) -> List[str]:
+        """
+        Edited locales whose translation is created, updated or deleted by the sent data
+        """
+        changed_locales = []
+        for locale in self.edited_locales:
+            data = self.cleaned_data_for_locales.get(locale) or {}
+            initial_data = self.initial_data_for_locales.get(locale)
+            if initial_data is None:
+                changed = not self.is_locale_empty(locale)
+            elif self.is_locale_empty(locale):
+                changed = True
+            else:
+                changed = any(
+                    # StreamValue compare their blocks, empty values may be None or ""
+                    (value or initial_data.get(field_name))
+                    and value != initial_data.get(field_name)
+                    for field_name, value in data.items()
+                )
+            if changed:
+                changed_locales.append(locale)
+        return changed_locales
+
+    def _save_locales(self, created: bool = False) -> None:
+        """
+        Save translations of changed locales in bulk (see `bulk_save_translations`), or locale per
+        locale if translations can not be saved in bulk.
+        Translations of the instance must be in its cache (see `load_translations`), unless it
+        was just `created`.
+        """
+        obj = self.instance  # type: ignore
+        i18n_meta = obj._parler_meta.root
+        if not can_bulk_save_translations(i18n_meta.model):
+            for locale in self.changed_locales:
+                self._save_locale(locale)
+            return
+        locale_cache = obj._translations_cache[i18n_meta.model]
+        if created:
+            # a new instance has no translation: do not query them
+            for locale in self.changed_locales:
+                locale_cache.setdefault(locale, MISSING)
+        to_save: List[TranslatedFieldsModel] = []
+        to_delete: List[TranslatedFieldsModel] = []
+        for locale in self.changed_locales:
+            data = self.cleaned_data_for_locales.get(locale)
+            if not data or self.is_locale_empty(locale):
+                translation = locale_cache.get(locale)
+                if translation is None or is_missing(translation):
+                    continue
+                if translation.pk:
+                    to_delete.append(translation)
+                else:
+                    locale_cache[locale] = MISSING  # never saved
+                continue
+            translation = obj._get_translated_model(locale, auto_create=True, meta=i18n_meta)
+            for field_name, value in data.items():
+                setattr(translation, field_name, value)
+            if translation.pk is None or translation.is_modified:
+                to_save.append(translation)
+        bulk_save_translations(obj, to_save, to_delete)
+
     def clean(self) -> Dict:
         """
         Prepare cleaned_data_for_locales of translated fields
         """
-        rich_text_re = re.compile(r'^<p data-block-key="[^"]*"></p>$')
+        cleaned_data = self.cleaned_data  # type: ignore
         self.cleaned_data_for_locales = {}
-        for conf in settings.PARLER_LANGUAGES[None]:
-            data = self.cleaned_data_for_locales[conf["code"]] = {}
-            for field_name, i18n_field_name in self.get_localized_fieldnames(conf["code"]):
-                if i18n_field_name in self.cleaned_data:  # type: ignore
-                    if isinstance(
-                        self.fields[i18n_field_name].widget, DraftailRichTextArea
-                    ) and rich_text_re.search(self.cleaned_data[i18n_field_name]):
-                        data[field_name] = ""  # it's only the default empty <p> tag
-                    else:
-                        data[field_name] = self.cleaned_data[i18n_field_name]  # type: ignore
+        for locale in self.edited_locales:
+            data = self.cleaned_data_for_locales[locale] = {}
+            for field_name, i18n_field_name in self.parler_fieldnames_by_locale[locale]:
+                if i18n_field_name in cleaned_data:
+                    value = cleaned_data[i18n_field_name]
+                    detector = self.parler_emptiness_detectors.get(field_name)
+                    if detector is is_empty_rich_text and EMPTY_RICH_TEXT_RE.search(value or ""):
+                        value = ""  # it's only the default empty <p> tag
+                    data[field_name] = value
         return super().clean()  # type: ignore
 
     @transaction.atomic
@@ -161,14 +442,14 @@ class AutoParlerModelForm(Form):
         """
         Save the instance and it's translations
         """
+        created = self.instance._state.adding  # type: ignore
         instance = super().save(*args, **kwargs)  # type: ignore
         if kwargs.get("commit", True):
-            for conf in settings.PARLER_LANGUAGES[None]:
-                self._save_locale(conf["code"])
+            self._save_locales(created=created)
         else:
-            for conf in settings.PARLER_LANGUAGES[None]:
-                self._set_locale(conf["code"])
-            wagtail_parler_locale_tab = self.data.get("wagtail_parler_locale_tab", None)
+            for locale in self.edited_locales:
+                self._set_locale(locale)
+            wagtail_parler_locale_tab = self.data.get(LOCALE_TAB_FIELD_NAME, None)
             available_codes = [conf["code"] for conf in settings.PARLER_LANGUAGES[None]]
             if not wagtail_parler_locale_tab or wagtail_parler_locale_tab not in available_codes:
                 wagtail_parler_locale_tab = self.instance.get_current_language()
@@ -196,9 +477,10 @@ def build_translations_form(
     if "exclude" not in main_form_meta_attrs and "fields" not in main_form_meta_attrs:
         main_form_meta_attrs["fields"] = "__all__"
 
-    attrs = {
+    attrs: Dict[str, Any] = {
         "Meta": type("Meta", (WagtailAdminModelForm.Meta,), main_form_meta_attrs),
-        "auto_parler_fields": set(),
+        "parler_locales": [conf["code"] for conf in settings.PARLER_LANGUAGES[None]],
+        "parler_fieldnames_by_locale": {},
     }
     i18n_model = model._parler_meta.root_model  # pylint: disable=protected-access
     if fields_for_model_kwargs:
@@ -207,8 +489,21 @@ def build_translations_form(
     else:
         fields_for_model_kwargs = {}
     fields_for_model_kwargs["model"] = i18n_model
-    for conf in settings.PARLER_LANGUAGES[None]:
-        for field_name, field in fields_for_model(**fields_for_model_kwargs).items():
-            attrs["auto_parler_fields"].add(field_name)  # type: ignore
-            attrs["translations_%s_%s" % (conf["code"], field_name)] = field
+    # introspect the translations model once, then copy its fields for each locale
+    i18n_fields = fields_for_model(**fields_for_model_kwargs)
+    attrs["auto_parler_fields"] = set(i18n_fields)
+    attrs["parler_emptiness_detectors"] = {
+        field_name: get_emptiness_detector(field) for field_name, field in i18n_fields.items()
+    }
+    default_locale = attrs["parler_locales"][0]
+    for locale in attrs["parler_locales"]:
+        fieldnames = attrs["parler_fieldnames_by_locale"][locale] = []
+        for field_name, field in i18n_fields.items():
+            i18n_field_name = "translations_%s_%s" % (locale, field_name)
+            fieldnames.append((field_name, i18n_field_name))
+            i18n_field = attrs[i18n_field_name] = deepcopy(field)
+            if locale != default_locale:
+                # fields of others locales than the default one must NOT be required
+                i18n_field.required = i18n_field.widget.is_required = False
+                i18n_field.label = format_lazy("{} ({})", i18n_field.label, locale.upper())
     return type("%sForm" % model.__name__, (AutoParlerModelForm, base_form), attrs)
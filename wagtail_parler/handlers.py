@@ -3,96 +3,273 @@ from __future__ import annotations
 
 # Standard libs
 from copy import copy
-from copy import deepcopy
 from functools import partial
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
+    from typing import Any
+    from typing import Callable
     from typing import Dict
     from typing import List
     from typing import Optional
     from typing import Set
     from typing import Tuple
-
-    from wagtail.admin.compare import FieldComparison
-    from wagtail.admin.panels import Panel
+    from typing import Type
+
+    from django.db.models import Field
+    from django.http import HttpRequest
+    from django.http import HttpResponse
+    from django.http import QueryDict
+    from django.urls import URLPattern
+    from django.utils.safestring import SafeString
     from wagtail_modeladmin.options import ModelAdmin
 
 # Django imports
 from django.conf import settings
+from django.contrib.admin.utils import quote
+from django.contrib.admin.utils import unquote
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import PermissionDenied
+from django.core.signals import setting_changed
 from django.db.models import Model
+from django.dispatch import receiver
 from django.forms.models import fields_for_model
+from django.forms.utils import flatatt
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.urls import path
+from django.urls import re_path
+from django.urls import reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+from django.utils.http import urlencode
+from django.utils.text import format_lazy
 from django.utils.translation import gettext_lazy as _
 
 # Third Party
 from wagtail import VERSION as WAGTAIL_VERSION
+from wagtail.admin.compare import FieldComparison
 from wagtail.admin.panels import FieldPanel
 from wagtail.admin.panels import ObjectList
+from wagtail.admin.panels import Panel
 from wagtail.admin.panels import TabbedInterface
 from wagtail.admin.panels import TitleFieldPanel
+from wagtail.models import DraftStateMixin
 from wagtail.snippets.views.snippets import SnippetViewSet
 
 # wagtail / parler
 from wagtail_parler import settings as wp_settings
 
 # Local Apps
+from .forms import PICKED_LOCALES_FIELD_NAME
+from .forms import SENT_LOCALES_FIELD_NAME
+from .forms import UNLOADED_LOCALES_FIELD_NAME
 from .forms import build_translations_form
+from .models import get_revision_translation_digest
+from .models import get_translated_languages
+from .models import get_translation_for_comparison
+from .views import TranslationsTabView
+from .views import get_parler_view_class
+
+# Edit handlers already built, by admin (ModelAdmin or SnippetViewSet) then by languages conf
+_edit_handlers_cache: WeakKeyDictionary = WeakKeyDictionary()
+# Form classes already built, by edit handler
+_form_classes_cache: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def get_languages_cache_key() -> Tuple:
+    """
+    Key identifying the current languages configuration, used to cache what depends on it
+    """
+    return (
+        tuple(conf["code"] for conf in settings.PARLER_LANGUAGES[None]),
+        tuple(code for code, _label in settings.LANGUAGES),
+    )
+
+
+@receiver(setting_changed)
+def clear_edit_handlers_cache(setting: str, **kwargs: Any) -> None:
+    if setting in ("LANGUAGES", "LANGUAGE_CODE") or setting.startswith(
+        ("PARLER_", "WAGTAIL_PARLER_")
+    ):
+        _edit_handlers_cache.clear()
+
+
+class UnchangedFieldComparison(FieldComparison):
+    """
+    Comparison of a field known to be unchanged: values are not compared at all
+    """
+
+    def has_changed(self) -> bool:
+        return False
+
+
+def compare_translated_field(
+    comparator_class: Type[FieldComparison],
+    field: Field,
+    locale: str,
+    translation_model: Model,
+    obj_a: Model,
+    obj_b: Model,
+) -> FieldComparison:
+    """
+    Compare the translated field of two instances in the given locale.
+    The comparison is done between translations (fallbacks included) of each instance and
+    skipped if both translations have the same revision data.
+    """
+    translation_a = get_translation_for_comparison(obj_a, locale, translation_model)
+    translation_b = get_translation_for_comparison(obj_b, locale, translation_model)
+    digest_a = get_revision_translation_digest(obj_a, translation_a.language_code)
+    if digest_a and digest_a == get_revision_translation_digest(
+        obj_b, translation_b.language_code
+    ):
+        comparator_class = UnchangedFieldComparison
+    return comparator_class(field, translation_a, translation_b)
 
 
 class TranslationsList(ObjectList):
     class BoundPanel(ObjectList.BoundPanel):
+        def __init__(self, *args: Tuple, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            # heading depends on the instance: compute it here to keep the panel untouched
+            self.heading = self.panel.get_parler_heading(
+                self.instance, self._get_translated_languages()
+            )
+
         @property
         def parler_locale(self) -> str:
             return self.panel.current_parler_language
 
+        @cached_property
+        def is_lazy(self) -> bool:
+            """
+            Whether tabs of the form may be loaded on demand: never in revert and copy views
+            """
+            if not self.panel.lazy_url_name or self.form is None or self.request is None:
+                return False
+            return getattr(self.form, "parler_lazy_tabs", True)
+
+        @cached_property
+        def is_deferred(self) -> bool:
+            """
+            Whether this tab is rendered as a placeholder loaded on demand (lazy tabs).
+            The default locale and the locales sent with the form are always rendered.
+            """
+            if not self.is_lazy:
+                return False
+            if self.parler_locale == settings.PARLER_LANGUAGES[None][0]["code"]:
+                return False
+            return not self.form.is_bound or self.parler_locale not in self.form.edited_locales
+
+        def is_shown(self) -> bool:
+            if self.form is not None and self.parler_locale not in getattr(
+                self.form, "parler_locales", (self.parler_locale,)
+            ):
+                return False
+            # fields of a deferred tab are not in the form but the tab must be kept
+            return self.is_deferred or super().is_shown()
+
+        def get_locales_picker(self) -> List[Dict]:
+            """
+            Locales which can be picked to be edited, with the url to (un)pick each of them
+            """
+            picked = getattr(self.form, "parler_locales", [])
+            editable = getattr(self.form, "parler_editable_locales", None)
+            locale_labels = dict(settings.LANGUAGES)
+            locales = []
+            for i, conf in enumerate(settings.PARLER_LANGUAGES[None]):
+                code = conf["code"]
+                if editable is not None and code not in editable:
+                    continue
+                selected = code in picked
+                url = None
+                if i:  # the default locale is always edited
+                    new_picked = [c for c in picked if c != code] if selected else [*picked, code]
+                    url = "?" + urlencode({PICKED_LOCALES_FIELD_NAME: new_picked}, doseq=True)
+                locales.append(
+                    {"code": code, "label": locale_labels[code], "selected": selected, "url": url}
+                )
+            return locales
+
+        def get_deferred_url(self) -> str:
+            kwargs = {"locale": self.parler_locale}
+            if self.instance is not None and self.instance.pk:
+                kwargs["pk"] = quote(self.instance.pk)
+            url = reverse(self.panel.lazy_url_name, kwargs=kwargs)
+            if self.panel.locales_picker:
+                # the tab is rendered with the form of the picked locales
+                picked = getattr(self.form, "parler_locales", [])
+                url += "?" + urlencode({PICKED_LOCALES_FIELD_NAME: picked}, doseq=True)
+            return url
+
+        def render_html(self, parent_context: Optional[Dict] = None) -> SafeString:
+            if not self.is_deferred:
+                html = super().render_html(parent_context)
+            else:
+                html = render_to_string(
+                    "wagtail_parler/panels/deferred_translations_list.html",
+                    {
+                        "self": self,
+                        "url": self.get_deferred_url(),
+                        "unloaded_locales_field_name": UNLOADED_LOCALES_FIELD_NAME,
+                    },
+                )
+            if self.panel.partial_submit and self.is_lazy and not self.is_deferred:
+                # the script removes unchanged tabs (their locale and fields) from sent data
+                attrs = {
+                    "type": "hidden",
+                    "name": SENT_LOCALES_FIELD_NAME,
+                    "value": self.parler_locale,
+                }
+                # after an invalid submission, pending changes of the tab must be sent again
+                if (
+                    self.parler_locale != settings.PARLER_LANGUAGES[None][0]["code"]
+                    and not self.form.is_bound
+                ):
+                    attrs["data-wagtail-parler-partial-locale"] = self.parler_locale
+                html = format_html("<input{}>{}", flatatt(attrs), html)
+            if not self.panel.locales_picker:
+                return html
+            # picked locales are sent with the form to build the same form on POST
+            html = format_html(
+                '<input type="hidden" name="{}" value="{}">{}',
+                PICKED_LOCALES_FIELD_NAME,
+                self.parler_locale,
+                html,
+            )
+            if self.parler_locale == settings.PARLER_LANGUAGES[None][0]["code"]:
+                picker = render_to_string(
+                    "wagtail_parler/panels/locales_picker.html",
+                    {"self": self, "locales": self.get_locales_picker()},
+                )
+                html = format_html("{}{}", picker, html)
+            return html
+
+        def _get_translated_languages(self) -> Set[str]:
+            """
+            Translated languages of the instance, resolved once and shared by all
+            TranslationsList bound with the same form (or with the same instance when they are
+            bound without form: read only panels).
+            """
+            holder = self.form if self.form is not None else self.instance
+            translated_languages = getattr(holder, "_wagtail_parler_translated_languages", None)
+            if translated_languages is None:
+                translated_languages = get_translated_languages(self.instance)
+                if holder is not None:
+                    holder._wagtail_parler_translated_languages = translated_languages
+            return translated_languages
+
         def _get_comparison_for_child(
-            self, child: ObjectList.BoundPanel, comparators: List[FieldComparison]
+            self, child: ObjectList.BoundPanel, comparators: List[Callable]
         ) -> None:
-            child = copy(child)
-            if hasattr(child, "children"):
-                for subchild in child.children:
-                    self._get_comparison_for_child(subchild, comparators)
-            if not hasattr(child, "field_name"):
-                return
-            translation_model = self.instance._parler_meta.root_model
-            child.model = child.panel.model = translation_model
-            child.panel = deepcopy(child.panel)
-
-            child.panel.field_name = child.field_name.replace(
-                f"translations_{self.parler_locale}_", ""
-            )
-            # child.instance = translation
-            orig_field = child.panel.db_field
-            child.panel.db_field = deepcopy(child.panel.db_field)
-            child.panel.db_field.verbose_name += f" [{self.panel.current_parler_language}]"
-            sub_comparators = child.get_comparison()
-            new_sub_comparator = []
-            for comparator in sub_comparators:
-                comparator.current_locale = self.parler_locale
-
-                def translated_comparator(
-                    comparator: FieldComparison, obj_a: Model, obj_b: Model
-                ) -> FieldComparison:
-                    current_locale_a = obj_a.get_current_language()
-                    current_locale_b = obj_b.get_current_language()
-                    obj_a.set_current_language(comparator.current_locale)
-                    obj_b.set_current_language(comparator.current_locale)
-                    # hack: set PKs to None to not use parler cache during comparison
-                    old_pk_a, old_pk_b = obj_a.pk, obj_b.pk
-                    obj_a.pk = obj_b.pk = None
-                    comparison = comparator(obj_a, obj_b)
-                    obj_a.pk, obj_b.pk = old_pk_a, old_pk_b
-                    obj_a.set_current_language(current_locale_a)
-                    obj_b.set_current_language(current_locale_b)
-                    return comparison
-
-                new_sub_comparator.append(partial(translated_comparator, comparator))
-            comparators.extend(new_sub_comparator)
-            child.panel.db_field = orig_field
-            child.panel.field_name = f"translations_{self.parler_locale}_{child.panel.field_name}"
+            for subchild in getattr(child, "children", ()):
+                self._get_comparison_for_child(subchild, comparators)
+            if hasattr(child, "field_name") and child.is_shown():
+                comparators.extend(self.panel.translated_comparators.get(child.field_name, ()))
 
         def get_comparison(self) -> list:
-            comparators: list[FieldComparison] = []
+            comparators: List[Callable] = []
             for child in self.children:
                 self._get_comparison_for_child(child, comparators)
             return comparators
@@ -102,13 +279,26 @@ class TranslationsList(ObjectList):
         self.initial_parler_heading = kwargs.pop(
             "initial_parler_heading", kwargs.pop("heading", None)
         )
+        # url name of the view rendering this tab on demand, if tabs are lazy loaded
+        self.lazy_url_name = kwargs.pop("lazy_url_name", None)
+        # whether the editor picks the locales to edit
+        self.locales_picker = kwargs.pop("locales_picker", False)
+        # whether fields of this tab are sent only if changed (requires lazy tabs)
+        self.partial_submit = kwargs.pop("partial_submit", False)
+        # children shared by the tabs of all locales, with their bound panel once bound
+        self.shared_panels = kwargs.pop("shared_panels", None)
         super().__init__(*args, **kwargs)
 
     @property
     def clean_name(self) -> str:
         return "parler_translations_%s" % (self.current_parler_language or "all")
 
-    def _set_parler_heading(self, instance: Model) -> None:
+    def get_parler_heading(
+        self, instance: Optional[Model], translated_languages: Optional[Set[str]] = None
+    ) -> str:
+        """
+        Return the heading of this tab depending on the translation status of `instance`
+        """
         current_parler_language = getattr(self, "current_parler_language", None)
         conf = next(
             conf
@@ -118,7 +308,9 @@ class TranslationsList(ObjectList):
         locale_labels = dict(settings.LANGUAGES)
         headings_conf = wp_settings.HEADINGS_CONF  # type: ignore
         if instance and instance.pk:
-            if not instance.has_translation(conf["code"]):
+            if translated_languages is None:
+                translated_languages = get_translated_languages(instance)
+            if conf["code"] not in translated_languages:
                 conf_heading = headings_conf["untranslated"]
             else:
                 conf_heading = headings_conf["translated"]
@@ -133,28 +325,137 @@ class TranslationsList(ObjectList):
                 "status": conf_heading["status"],
                 **conf,
             }
-        self.heading = heading
+        return heading  # type: ignore
+
+    def on_model_bound(self) -> None:
+        shared_panels = self.shared_panels
+        if not shared_panels:
+            return super().on_model_bound()
+        # children shared by all locales are bound once, then reused by the tabs of others locales
+        children: List = self.children  # type: ignore
+        self.children = [child for child in children if child not in shared_panels]
+        super().on_model_bound()
+        bound_children = iter(self.children)
+        self.children = []
+        for child in children:
+            if child not in shared_panels:
+                self.children.append(next(bound_children))
+                continue
+            if shared_panels[child] is None:
+                shared_panels[child] = child.bind_to_model(self.model)
+            self.children.append(shared_panels[child])
+
+    @cached_property
+    def translated_comparators(self) -> Dict[str, List[Callable]]:
+        """
+        Comparators of the translated fields of this tab, by form field name.
+        Built once from the panels bound to the translation model, then reused by all
+        revisions comparisons.
+        """
+        comparators: Dict[str, List[Callable]] = {}
+        locale: str = self.current_parler_language  # type: ignore
+        prefix = "translations_%s_" % locale
+
+        def add_comparators(panel: Panel) -> None:
+            for child in getattr(panel, "children", ()):
+                add_comparators(child)
+            if not isinstance(panel, FieldPanel) or not panel.field_name.startswith(prefix):
+                return
+            field_name = panel.field_name.replace(prefix, "", 1)
+            translation_model = self.model._parler_meta.get_model_by_field(field_name)
+            translation_panel = panel.__class__(
+                **{**panel.clone_kwargs(), "field_name": field_name}
+            ).bind_to_model(translation_model)
+            comparator_class = translation_panel.get_comparison_class()
+            try:
+                db_field = copy(translation_panel.db_field)
+            except FieldDoesNotExist:
+                return
+            db_field.verbose_name = format_lazy("{} [{}]", db_field.verbose_name, locale)
+            comparators[panel.field_name] = [
+                partial(
+                    compare_translated_field, comparator_class, db_field, locale, translation_model
+                )
+            ]
+
+        for child in self.children:
+            add_comparators(child)
+        return comparators
 
     def clone_kwargs(self) -> Dict:
         kwargs = super().clone_kwargs()
         kwargs["current_parler_language"] = getattr(self, "current_parler_language", None)
         kwargs["initial_parler_heading"] = getattr(self, "initial_parler_heading", self.heading)
+        kwargs["lazy_url_name"] = getattr(self, "lazy_url_name", None)
+        kwargs["locales_picker"] = getattr(self, "locales_picker", False)
+        kwargs["partial_submit"] = getattr(self, "partial_submit", False)
+        kwargs["shared_panels"] = getattr(self, "shared_panels", None)
         return kwargs
 
-    def get_bound_panel(
-        self, instance: Model = None, *args: Tuple, **kwargs: Dict
-    ) -> ObjectList.BoundPanel:
-        self._set_parler_heading(instance)
-        return super().get_bound_panel(instance, *args, **kwargs)
-
 
 class ParlerAdminWagtailMixin:
     """
     Mixin to manage translations via Parler inside a ModelAdmin or SnippetViewSet
 
     You **SHOULD NOT** use this Mixin directly but ParlerModelAdminMixin or ParlerSnippetAdminMixin
+
+    Set `parler_lazy_tabs` to True to render only the tab of the default locale with the edit
+    form: others tabs are loaded the first time they are opened and translations of tabs never
+    opened are left untouched on save.
+
+    Set `parler_partial_submit` to True (with `parler_lazy_tabs`) to send fields of changed tabs
+    only: translations of unchanged tabs are left untouched on save.
+
+    Set `parler_locales_picker` to True to let the editor pick the locales to edit: the form
+    and its tabs are built for the default locale and the picked ones only.
+
+    Set `parler_trim_preview_session` to True to store in the session the preview data of the
+    previewed locale (and its fallbacks) only and `parler_compress_preview_session` to compress
+    them (snippets only).
     """
 
+    parler_lazy_tabs = False
+    parler_partial_submit = False
+    parler_locales_picker = False
+    parler_trim_preview_session = False
+    parler_compress_preview_session = False
+
+    def get_parler_locales_for_user(self, user: Any) -> Optional[List[str]]:
+        """
+        Return locales `user` may edit, or None if all locales are editable.
+        Fields of others locales are not in his forms and their translations are left untouched.
+        """
+        return None
+
+    def get_parler_form_class(
+        self, form_class: type, request: HttpRequest, data: QueryDict
+    ) -> type:
+        """
+        Return `form_class` restricted to the locales the user may edit and picked
+        """
+        if not hasattr(form_class, "for_locales"):
+            return form_class
+        user_locales = self.get_parler_locales_for_user(request.user)
+        if user_locales is not None:
+            form_class = form_class.for_user_locales(user_locales)  # type: ignore
+        locales = self.get_parler_locales(request, data)
+        if locales is not None:
+            form_class = form_class.for_locales(locales)
+        return form_class
+
+    def get_parler_locales(self, request: HttpRequest, data: QueryDict) -> Optional[List[str]]:
+        """
+        Return locales to edit (the default locale is always edited) or None to edit all of them
+        """
+        if not self.parler_locales_picker:
+            return None
+        picked = data.getlist(PICKED_LOCALES_FIELD_NAME)
+        return [
+            conf["code"]
+            for i, conf in enumerate(settings.PARLER_LANGUAGES[None])
+            if not i or conf["code"] in picked
+        ]
+
     def _set_translations_handlers(
         self: ModelAdmin, handlers: List, base_handler: Optional[TranslationsList] = None
     ) -> Set[str]:
@@ -168,51 +469,95 @@ class ParlerAdminWagtailMixin:
         for I18nModel in self.model._parler_meta.get_all_models():
             translated_fields += [*fields_for_model(I18nModel).keys()]
         displayed_fields = set()
-        if not base_handler or not getattr(base_handler, "children"):
+        if not base_handler:
+            base_handler = TranslationsList(heading="")  # type: ignore
+        children = base_handler.children
+        if not children:
             children = []
             for field_name in translated_fields:
                 if field_name != "language_code":
                     children.append(FieldPanel(field_name))
-            if not base_handler:
-                base_handler = TranslationsList(
-                    heading="",  # type: ignore
-                    children=children,  # type: ignore
-                )
-            else:
-                base_handler.children = children
 
         first_title_field_targets = set()
 
-        def recurse_child_replace(handler: Panel, locale: str) -> None:
-            for child in handler.children:
-                if isinstance(child, FieldPanel) and child.field_name in translated_fields:
-                    if isinstance(child, TitleFieldPanel) and child.targets:
-                        new_targets = []
-                        for target in child.targets:
-                            if target in translated_fields:
-                                target = "translations_%s_%s" % (locale, target)
-                            elif target in first_title_field_targets:
-                                continue
-                            else:
-                                first_title_field_targets.add(target)
-                            new_targets.append(target)
-                        child.targets = new_targets
-                    displayed_fields.add(child.field_name)
-                    child.field_name = "translations_%s_%s" % (locale, child.field_name)
-                if hasattr(child, "children"):
-                    recurse_child_replace(child, locale)
-
+        def clone_for_locale(panel: Panel, locale: str) -> Panel:
+            """
+            Panels without translated fields are shared between locales. Others are cloned
+            (without copying their widgets, headings…) with their translated fields renamed.
+            """
+            if isinstance(panel, FieldPanel):
+                if panel.field_name not in translated_fields:
+                    return panel
+                clone_kwargs = panel.clone_kwargs()
+                if isinstance(panel, TitleFieldPanel) and panel.targets:
+                    new_targets = []
+                    for target in panel.targets:
+                        if target in translated_fields:
+                            target = "translations_%s_%s" % (locale, target)
+                        elif target in first_title_field_targets:
+                            continue
+                        else:
+                            first_title_field_targets.add(target)
+                        new_targets.append(target)
+                    clone_kwargs["targets"] = new_targets
+                displayed_fields.add(panel.field_name)
+                clone_kwargs["field_name"] = "translations_%s_%s" % (locale, panel.field_name)
+                return panel.__class__(**clone_kwargs)
+            panel_children = getattr(panel, "children", None)
+            if not panel_children:
+                return panel
+            new_children = [clone_for_locale(child, locale) for child in panel_children]
+            if all(new is old for new, old in zip(new_children, panel_children)):
+                return panel
+            clone_kwargs = panel.clone_kwargs()
+            clone_kwargs["children"] = new_children
+            return panel.__class__(**clone_kwargs)
+
+        # {panel: bound panel} of the children shared by all locales
+        shared_panels: Dict[Panel, Optional[Panel]] = {}
         for conf in settings.PARLER_LANGUAGES[None]:
-            handler = deepcopy(base_handler)
-            handler.current_parler_language = conf["code"]
-            handler._set_parler_heading(None)
-            recurse_child_replace(handler, conf["code"])
+            clone_kwargs = base_handler.clone_kwargs()
+            clone_kwargs["children"] = [
+                clone_for_locale(child, conf["code"]) for child in children
+            ]
+            for child in clone_kwargs["children"]:
+                if isinstance(child, Panel) and child in children:
+                    shared_panels.setdefault(child, None)
+            clone_kwargs["shared_panels"] = shared_panels
+            clone_kwargs["current_parler_language"] = conf["code"]
+            clone_kwargs["lazy_url_name"] = (
+                self.get_parler_translations_url_name() if self.parler_lazy_tabs else None
+            )
+            clone_kwargs["locales_picker"] = self.parler_locales_picker
+            clone_kwargs["partial_submit"] = self.parler_lazy_tabs and self.parler_partial_submit
+            handler = base_handler.__class__(**clone_kwargs)
+            handler.heading = handler.get_parler_heading(None)
             handlers.append(handler)
         return displayed_fields
 
     def get_edit_handler(self: ModelAdmin) -> TabbedInterface:
         """
-        Prepare real handlers to be used with this Model Admin.
+        Return real handlers to be used with this Model Admin.
+        They are built once for the current languages configuration then reused.
+        """
+        handlers_by_languages = _edit_handlers_cache.setdefault(self, {})
+        cache_key = get_languages_cache_key()
+        if cache_key not in handlers_by_languages:
+            handlers_by_languages[cache_key] = self._build_edit_handler()
+        return handlers_by_languages[cache_key]
+
+    def get_parler_edit_form_class(self: ModelAdmin) -> type:
+        """
+        Return the form class of the edit handler, built once per edit handler
+        """
+        edit_handler = self.get_edit_handler()
+        if edit_handler not in _form_classes_cache:
+            _form_classes_cache[edit_handler] = edit_handler.get_form_class()
+        return _form_classes_cache[edit_handler]  # type: ignore
+
+    def _build_edit_handler(self: ModelAdmin) -> TabbedInterface:
+        """
+        Prepare real handlers to be used with this Model Admin, bound to its model.
         """
         base_handlers = super().get_edit_handler()  # type: ignore
         displayed_fields = None
@@ -259,7 +604,16 @@ class ParlerAdminWagtailMixin:
             fields_for_model_kwargs=form_options,
             base_form=getattr(self, "parler_base_form_class", None),
         )
-        return TabbedInterface(handlers, base_form_class=base_form_class)
+        edit_handler = TabbedInterface(handlers, base_form_class=base_form_class)
+        return edit_handler.bind_to_model(self.model)
+
+    def parler_translations_view(
+        self: ModelAdmin, request: HttpRequest, locale: str, pk: Optional[str] = None
+    ) -> HttpResponse:
+        """
+        Render the tab of `locale` on demand when tabs are lazy loaded
+        """
+        return TranslationsTabView.as_view(admin=self)(request, locale=locale, pk=pk)
 
 
 class ParlerModelAdminMixin(ParlerAdminWagtailMixin):
@@ -290,6 +644,37 @@ class ParlerModelAdminMixin(ParlerAdminWagtailMixin):
             )
     """
 
+    def __init__(self: ModelAdmin, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.create_view_class = get_parler_view_class(self.create_view_class)
+        self.edit_view_class = get_parler_view_class(self.edit_view_class)
+
+    def get_parler_translations_url_name(self: ModelAdmin) -> str:
+        return self.url_helper.get_action_url_name("parler_translations")
+
+    def get_parler_translations_instance(
+        self: ModelAdmin, request: HttpRequest, pk: Optional[str] = None
+    ) -> Model:
+        """
+        Return the instance edited by the tab rendered on demand if the user can edit it
+        """
+        if pk is None:
+            if not self.permission_helper.user_can_create(request.user):
+                raise PermissionDenied
+            return self.model()
+        instance = get_object_or_404(self.model, pk=unquote(pk))
+        if not self.permission_helper.user_can_edit_obj(request.user, instance):
+            raise PermissionDenied
+        return instance
+
+    def get_admin_urls_for_registration(self: ModelAdmin) -> Tuple:
+        url_name = self.get_parler_translations_url_name()
+        pattern = r"^%s/parler-translations/(?P<locale>[-\w]+)/" % self.url_helper.base_url_path
+        return super().get_admin_urls_for_registration() + (  # type: ignore
+            re_path(pattern + "$", self.parler_translations_view, name=url_name),
+            re_path(pattern + r"(?P<pk>[-\w]+)/$", self.parler_translations_view, name=url_name),
+        )
+
 
 class ParlerSnippetAdminMixin(ParlerAdminWagtailMixin, SnippetViewSet):
     """
@@ -326,5 +711,66 @@ class ParlerSnippetAdminMixin(ParlerAdminWagtailMixin, SnippetViewSet):
             )
     """
 
-    def get_edit_handler(self: SnippetViewSet) -> TabbedInterface:
-        return super().get_edit_handler().bind_to_model(self.model)
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        for attr in (
+            "add_view_class",
+            "edit_view_class",
+            "copy_view_class",  # wagtail >= 6
+            "preview_on_add_view_class",
+            "preview_on_edit_view_class",
+        ):
+            view_class = getattr(self, attr, None)
+            if view_class is not None:
+                # wagtail 5.0 and 5.1 build views with their own kwargs: set the admin on classes
+                setattr(self, attr, get_parler_view_class(view_class, parler_admin=self))
+
+    @property
+    def _edit_handler(self: SnippetViewSet) -> TabbedInterface:
+        # used by wagtail to build views: always the one of the current languages configuration
+        return self.get_edit_handler()
+
+    @_edit_handler.setter
+    def _edit_handler(self: SnippetViewSet, value: TabbedInterface) -> None:
+        # wagtail 5 sets it once in `__init__`
+        pass
+
+    def get_form_class(self: SnippetViewSet, for_update: bool = False) -> type:
+        return self.get_parler_edit_form_class()
+
+    def get_parler_translations_url_name(self: SnippetViewSet) -> str:
+        return self.get_url_name("parler_translations")
+
+    def get_parler_translations_instance(
+        self: SnippetViewSet, request: HttpRequest, pk: Optional[str] = None
+    ) -> Model:
+        """
+        Return the instance edited by the tab rendered on demand if the user can edit it
+        """
+        if pk is None:
+            if not self.permission_policy.user_has_permission(request.user, "add"):
+                raise PermissionDenied
+            return self.model()
+        instance = get_object_or_404(self.model, pk=unquote(pk))
+        if not self.permission_policy.user_has_permission_for_instance(
+            request.user, "change", instance
+        ):
+            raise PermissionDenied
+        if isinstance(instance, DraftStateMixin):
+            instance = instance.get_latest_revision_as_object()
+        return instance
+
+    def get_urlpatterns(self: SnippetViewSet) -> List[URLPattern]:
+        url_name = "parler_translations"
+        return super().get_urlpatterns() + [
+            path(
+                "parler-translations/<str:locale>/",
+                self.parler_translations_view,
+                name=url_name,
+            ),
+            path(
+                "parler-translations/<str:locale>/<str:pk>/",
+                self.parler_translations_view,
+                name=url_name,
+            ),
+        ]
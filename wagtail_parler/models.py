@@ -1,18 +1,58 @@
 # Future imports
 from __future__ import annotations
 
+# Standard libs
+import base64
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+from threading import Lock
 from typing import TYPE_CHECKING
+import zlib
 
+# Django imports
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db import router
+from django.db.models import QuerySet
+from django.db.models import signals
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.utils.translation import get_language
+
+# Third Party
+from modelcluster.models import ClusterableModel
 from modelcluster.models import get_serializable_data_for_fields
 from modelcluster.models import model_from_serializable_data
+from parler import signals as parler_signals
 from parler.cache import IsMissing
+from parler.cache import MISSING
+from parler.cache import _cache_translation
+from parler.cache import _delete_cached_translation
 from parler.cache import is_missing
 from parler.models import TranslatableModel
+from parler.models import TranslatedFieldsModel
+from parler.utils import get_language_settings
+from wagtail.models import Revision
 
 if TYPE_CHECKING:
+    from typing import Any
     from typing import Dict
+    from typing import Iterable
+    from typing import List
+    from typing import Optional
+    from typing import Set
     from typing import Tuple
 
+    from django.db.models import Model
+    from django.http import HttpRequest
+
+
+logger = logging.getLogger(__name__)
+
 
 class ToDelete(IsMissing):
     pass
@@ -20,8 +60,308 @@ class ToDelete(IsMissing):
 
 TO_DELETE = ToDelete()
 
+# keys of the revisions data of `WagtailParlerModel.parler_delta_revisions` models
+REVISION_REFS_KEY = "wagtail_parler_translations_refs"
+REVISION_DIGESTS_KEY = "wagtail_parler_translations_digests"
+REVISION_DEPTH_KEY = "wagtail_parler_delta_depth"
+# key of the translations changes of `WagtailParlerModel.parler_revisions_changes` models
+REVISION_CHANGES_KEY = "wagtail_parler_changes"
+# prefix of the compressed translations of `WagtailParlerModel.parler_compress_revisions` models
+COMPRESSED_TRANSLATIONS_PREFIX = "zlib:"
+
+
+def get_translated_languages(instance: TranslatableModel) -> Set[str]:
+    """
+    Return language codes of translations of `instance`. Its parler cache is used first (unsaved
+    translations and translations to delete of drafts), others languages are resolved with only
+    one query (or none if translations were prefetched).
+    """
+    if not instance or not instance.pk:
+        return set()
+    local_cache = instance._translations_cache[instance._parler_meta.root_model]
+    languages = {
+        locale for locale, translation in local_cache.items() if not is_missing(translation)
+    }
+    uncached = {conf["code"] for conf in settings.PARLER_LANGUAGES[None]} - local_cache.keys()
+    if uncached:
+        languages.update(uncached.intersection(instance.get_available_languages()))
+    return languages
+
+
+def load_translations(
+    instance: TranslatableModel, locales: Optional[Iterable[str]] = None
+) -> Dict[str, TranslatedFieldsModel]:
+    """
+    Load all translations of `instance` in its parler cache with only one query (or none if
+    translations were prefetched). `locales` (default: all languages) without translation are
+    marked as missing so parler will not query them again.
+    Return translations by language code, unsaved ones included.
+    """
+    i18n_meta = instance._parler_meta.root
+    local_cache = instance._translations_cache[i18n_meta.model]
+    if instance.pk and not instance._state.adding:
+        translations = instance._get_prefetched_translations(meta=i18n_meta)
+        if translations is None:
+            translations = instance._get_translated_queryset(meta=i18n_meta)
+        for translation in translations:
+            # unsaved changes and translations to delete are kept
+            if local_cache.get(translation.language_code, MISSING) is MISSING:
+                local_cache[translation.language_code] = translation
+        if locales is None:
+            locales = [conf["code"] for conf in settings.PARLER_LANGUAGES[None]]
+        for locale in locales:
+            local_cache.setdefault(locale, MISSING)
+    return {
+        locale: translation
+        for locale, translation in local_cache.items()
+        if not is_missing(translation)
+    }
+
+
+def can_bulk_save_translations(i18n_model: type) -> bool:
+    """
+    Return True if translations of `i18n_model` can be created and updated in bulk: their model
+    does not override save nor have many to many fields, and owns its fields: Django sends bulk
+    updates of fields shared by several models (translated fields of an abstract model reused by
+    its subclasses…) to the table of the last model they were added to.
+    """
+    i18n_meta = i18n_model._meta  # type: ignore
+    if i18n_meta.many_to_many:
+        return False
+    if any(field.model is not i18n_model for field in i18n_meta.concrete_fields):
+        return False
+    for method in ("save", "save_base"):
+        if getattr(i18n_model, method) is not getattr(TranslatedFieldsModel, method):
+            return False
+    # created translations must get their primary key back
+    using = router.db_for_write(i18n_model)
+    return bool(connections[using].features.can_return_rows_from_bulk_insert)
+
+
+def can_bulk_delete_translations(i18n_model: type) -> bool:
+    """
+    Return True if translations of `i18n_model` can be deleted in bulk: their model does not
+    override delete nor have delete signal receivers (deleted translations would be queried again
+    to send them the signals).
+    """
+    if getattr(i18n_model, "delete") is not getattr(TranslatedFieldsModel, "delete"):
+        return False
+    return not (
+        signals.pre_delete.has_listeners(i18n_model)
+        or signals.post_delete.has_listeners(i18n_model)
+    )
+
+
+def bulk_save_translations(
+    instance: TranslatableModel,
+    to_save: List[TranslatedFieldsModel],
+    to_delete: List[TranslatedFieldsModel],
+) -> None:
+    """
+    Save `to_save` and delete `to_delete` translations of `instance` with one query to create,
+    one to update and one to delete them (see `delete_translations`). Signals sent by
+    `TranslatedFieldsModel.save` and `delete` are sent for each translation and caches are
+    updated the same way.
+    """
+    i18n_meta = instance._parler_meta.root
+    i18n_model = i18n_meta.model
+    using = router.db_for_write(i18n_model, instance=instance)
+    shared_model = i18n_model.master.field.remote_field.model
+    to_create = []
+    for translation in to_save:
+        if translation.pk is None:
+            translation.master = instance
+            to_create.append(translation)
+        signals.pre_save.send(
+            sender=i18n_model, instance=translation, raw=False, using=using, update_fields=None
+        )
+        parler_signals.pre_translation_save.send(
+            sender=shared_model, instance=translation, raw=False, using=using
+        )
+    if to_create:
+        i18n_model.objects.using(using).bulk_create(to_create)
+    to_update = [translation for translation in to_save if translation not in to_create]
+    if to_update:
+        updated_fields = set()
+        for translation in to_update:
+            # bulk_update does not call pre_save (auto_now fields…)
+            for field in i18n_model._meta.concrete_fields:
+                if not field.primary_key:
+                    setattr(translation, field.attname, field.pre_save(translation, add=False))
+            for attname, original_value, value in zip(
+                translation._get_field_names(),
+                translation._original_values,
+                translation._get_field_values(),
+            ):
+                if value != original_value:
+                    updated_fields.add(i18n_model._meta.get_field(attname).name)
+        i18n_model.objects.using(using).bulk_update(to_update, sorted(updated_fields))
+    for translation in to_save:
+        translation._original_values = translation._get_field_values()
+        _cache_translation(translation)
+        created = translation in to_create
+        signals.post_save.send(
+            sender=i18n_model,
+            instance=translation,
+            created=created,
+            update_fields=None,
+            raw=False,
+            using=using,
+        )
+        parler_signals.post_translation_save.send(
+            sender=shared_model, instance=translation, created=created, raw=False, using=using
+        )
+    delete_translations(instance, i18n_model, to_delete)
+    if to_create:
+        getattr(instance, "_prefetched_objects_cache", {}).pop(i18n_meta.rel_name, None)
+
+
+def delete_translations(
+    instance: TranslatableModel,
+    i18n_model: type,
+    to_delete: List[TranslatedFieldsModel],
+) -> None:
+    """
+    Delete `to_delete` translations (of `i18n_model`) of `instance` in bulk (see
+    `bulk_delete_translations`), or one by one if they can not be deleted in bulk.
+    """
+    if can_bulk_delete_translations(i18n_model):
+        bulk_delete_translations(instance, i18n_model, to_delete)
+        return
+    locale_cache = instance._translations_cache[i18n_model]
+    for translation in to_delete:
+        translation.delete()
+        locale_cache[translation.language_code] = MISSING
+
+
+def bulk_delete_translations(
+    instance: TranslatableModel,
+    i18n_model: type,
+    to_delete: List[TranslatedFieldsModel],
+) -> None:
+    """
+    Delete `to_delete` translations (of `i18n_model`) of `instance` with one query. Signals sent
+    by `TranslatedFieldsModel.delete` are sent for each translation and caches are updated the
+    same way.
+    """
+    if not to_delete:
+        return
+    locale_cache = instance._translations_cache[i18n_model]
+    using = router.db_for_write(i18n_model, instance=instance)
+    shared_model = i18n_model.master.field.remote_field.model  # type: ignore
+    for translation in to_delete:
+        parler_signals.pre_translation_delete.send(
+            sender=shared_model, instance=translation, using=using
+        )
+    # Django sends its delete signals
+    i18n_model.objects.using(using).filter(  # type: ignore
+        pk__in=[translation.pk for translation in to_delete]
+    ).delete()
+    for translation in to_delete:
+        _delete_cached_translation(translation)
+        locale_cache[translation.language_code] = MISSING
+        parler_signals.post_translation_delete.send(
+            sender=shared_model, instance=translation, using=using
+        )
+    rel_name = instance._parler_meta[i18n_model].rel_name
+    getattr(instance, "_prefetched_objects_cache", {}).pop(rel_name, None)
+
+
+def get_translation_for_comparison(
+    instance: TranslatableModel, locale: str, translation_model: Optional[Model] = None
+) -> TranslatedFieldsModel:
+    """
+    Return the translation used to display `instance` in `locale` (fallbacks included) without
+    changing the current language of `instance`.
+    If `instance` comes from a revision, translations are read from the revision data only:
+    the database is not used.
+    If no translation exists, an empty one is returned.
+    """
+    meta = instance._parler_meta.root
+    if translation_model is not None:
+        meta = next(meta for meta in instance._parler_meta if meta.model is translation_model)
+    revision_translations = None
+    if meta is instance._parler_meta.root:
+        revision_translations = getattr(instance, "_revision_translations", None)
+    lang_dict = get_language_settings(locale)
+    for code in [locale, lang_dict["code"], *lang_dict["fallbacks"]]:
+        if revision_translations is not None:
+            if code in revision_translations:
+                return revision_translations[code]
+            continue
+        try:
+            return instance._get_translated_model(code, use_fallback=False, meta=meta)
+        except meta.model.DoesNotExist:
+            pass
+    return meta.model(language_code=locale)
+
+
+def get_revision_translation_digest(instance: TranslatableModel, locale: str) -> Optional[str]:
+    """
+    Return a digest of the serialized translation of `instance` in `locale` if `instance` comes
+    from a revision, so unchanged locales can be detected without comparing each field.
+    """
+    digests = getattr(instance, "_revision_translations_digests", None)
+    if digests is None:
+        return None
+    if locale not in digests:
+        trans_data = instance._revision_translations_data.get(locale)
+        digests[locale] = get_translation_data_digest(trans_data) if trans_data else None
+    return digests[locale]
+
+
+def get_translation_data_digest(trans_data: dict) -> str:
+    """
+    Return a digest of the serialized data `trans_data` of a translation
+    """
+    serialized = json.dumps(trans_data, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha1(serialized.encode()).hexdigest()
+
+
+def dump_revision_translations(translations: dict) -> str:
+    """
+    Return `translations` data of a revision serialized and compressed
+    """
+    serialized = json.dumps(translations, cls=DjangoJSONEncoder, separators=(",", ":"))
+    compressed = base64.b64encode(zlib.compress(serialized.encode(), 9)).decode()
+    return COMPRESSED_TRANSLATIONS_PREFIX + compressed
+
+
+def load_revision_translations(translations: Any) -> dict:
+    """
+    Return translations data of a revision, compressed or not
+    """
+    if isinstance(translations, str) and translations.startswith(COMPRESSED_TRANSLATIONS_PREFIX):
+        compressed = translations.removeprefix(COMPRESSED_TRANSLATIONS_PREFIX)
+        return json.loads(zlib.decompress(base64.b64decode(compressed)))  # type: ignore
+    return translations or {}
+
+
+def filter_revisions_by_locale(revisions: QuerySet, locale: str) -> QuerySet:
+    """
+    Return `revisions` changing the translation of `locale` (revisions of
+    `WagtailParlerModel.parler_revisions_changes` models only)
+    """
+    return revisions.filter(**{"content__%s__has_key" % REVISION_CHANGES_KEY: locale})
+
+
+def get_revisions_changes(revisions: QuerySet) -> Dict[Any, Optional[dict]]:
+    """
+    Return by pk the translations changes of `revisions` without loading their whole content
+    """
+    return dict(revisions.values_list("pk", "content__%s" % REVISION_CHANGES_KEY))
+
 
 class WagtailParlerModel(TranslatableModel):
+    # store translations of unchanged locales in revisions as references to previous revisions
+    parler_delta_revisions = False
+    # maximum number of revisions between two revisions storing all translations
+    parler_revisions_snapshot_interval = 10
+    # store translations in revisions compressed
+    parler_compress_revisions = False
+    # store in revisions the languages and fields changed since the previous revision
+    parler_revisions_changes = False
+
     class Meta:
         abstract = True
 
@@ -30,7 +370,11 @@ class WagtailParlerModel(TranslatableModel):
             data = super().serializable_data()
         except AttributeError:
             data = get_serializable_data_for_fields(self)
-        data.update(self._serializable_translated_data())
+        translated_data = self._serializable_translated_data()
+        if self.parler_compress_revisions:
+            rel_name = self._parler_meta.root_rel_name
+            translated_data[rel_name] = dump_revision_translations(translated_data[rel_name])
+        data.update(translated_data)
         return data
 
     @classmethod
@@ -57,11 +401,22 @@ class WagtailParlerModel(TranslatableModel):
         locale_cache = instance._translations_cache[i18n_model]
 
         empty_locales = []
-        old_translations = data.get(instance._parler_meta.root_rel_name, {})
-        current_translations = {}
+        revision_translations = {}
+        old_translations = load_revision_translations(
+            data.get(instance._parler_meta.root_rel_name)
+        )
+        digests = dict(data.get(REVISION_DIGESTS_KEY, {}))
+        unresolved_locales = set()
+        if data.get(REVISION_REFS_KEY):
+            old_translations = dict(old_translations)
+            unresolved_locales = cls._resolve_revision_refs(
+                old_translations, data[REVISION_REFS_KEY]
+            )
+            for locale in unresolved_locales:
+                digests.pop(locale, None)
         for locale in instance.get_available_languages(include_unsaved=True):
-            current_translations[locale] = instance.get_translation(locale)
-            if locale not in old_translations:
+            # translations of purged revisions are kept unchanged
+            if locale not in old_translations and locale not in unresolved_locales:
                 locale_cache[locale] = TO_DELETE
 
         for locale, trans_data in old_translations.items():
@@ -70,6 +425,7 @@ class WagtailParlerModel(TranslatableModel):
                 empty_locales.append(locale)
             else:
                 instance._set_translated_fields(**trans_data)
+                revision_translations[locale] = locale_cache[locale]
         original_state = instance._state.adding
         instance._state.adding = True
         # Hack to avoid fetching from DB in case we empty a translation
@@ -78,18 +434,41 @@ class WagtailParlerModel(TranslatableModel):
             # fallbacks if available
             locale_cache[locale] = instance._get_translated_model(locale, use_fallback=True)
         instance._state.adding = original_state
+        # used to compare revisions without hitting the database
+        instance._revision_translations = revision_translations
+        instance._revision_translations_data = old_translations
+        instance._revision_translations_digests = digests
+
+    @classmethod
+    def _resolve_revision_refs(cls, translations: dict, refs: Dict[str, int]) -> Set[str]:
+        """
+        Add to `translations` the data of locales stored in the revisions referenced by `refs`
+        with one query. Return locales whose referenced revision does not exist anymore.
+        """
+        rel_name = cls._parler_meta.root_rel_name
+        contents = dict(
+            Revision.objects.filter(pk__in=set(refs.values())).values_list("pk", "content")
+        )
+        unresolved = set()
+        for locale, revision_pk in refs.items():
+            content = contents.get(revision_pk, {})
+            trans_data = load_revision_translations(content.get(rel_name)).get(locale)
+            if trans_data is None:
+                logger.warning(
+                    "Translation %r of %s is stored in revision %s which does not exist anymore",
+                    locale,
+                    cls._meta.label,
+                    revision_pk,
+                )
+                unresolved.add(locale)
+            else:
+                translations[locale] = trans_data
+        return unresolved
 
     def _serializable_translated_data(self) -> dict:
         translations = {}
-        i18n_meta = self._parler_meta.root
-        i18n_model = i18n_meta.model
-        for locale in self.get_available_languages():  # force to load translations
-            self.has_translation(locale)
-
-        for locale, translation in self._translations_cache[i18n_model].items():
-            if is_missing(translation):
-                continue
-            # translation = self.get_translation(locale)
+        # load all translations with one query, unsaved ones are kept
+        for locale, translation in load_translations(self).items():
             if hasattr(translation, "serializable_data") and callable(
                 translation.serializable_data
             ):
@@ -97,9 +476,94 @@ class WagtailParlerModel(TranslatableModel):
             else:
                 trans_data = get_serializable_data_for_fields(translation)
             translations[locale] = trans_data
-        return {
+        data = {
             self._parler_meta.root_rel_name: translations,
         }
+        if self.parler_revisions_changes:
+            data[REVISION_CHANGES_KEY] = self._get_revision_changes(translations)
+        if self.parler_delta_revisions:
+            data.update(self._get_delta_translated_data(translations))
+        return data
+
+    def _get_revision_changes(self, translations: dict) -> dict:
+        """
+        Return by language the change ("added", "removed" or "modified") of its translation since
+        the previous revision and the names of the changed fields
+        """
+        previous = getattr(self, "latest_revision", None) if self.pk else None
+        previous_translations: dict = {}
+        previous_digests: dict = {}
+        if previous is not None:
+            content = previous.content
+            previous_translations = dict(
+                load_revision_translations(content.get(self._parler_meta.root_rel_name))
+            )
+            previous_digests = content.get(REVISION_DIGESTS_KEY, {})
+            if content.get(REVISION_REFS_KEY):
+                self._resolve_revision_refs(previous_translations, content[REVISION_REFS_KEY])
+        i18n_model = self._parler_meta.root_model
+        field_names = i18n_model.get_translated_fields()
+        changes = {}
+        for locale in sorted(previous_translations.keys() | translations.keys()):
+            if locale not in translations:
+                change, new_data = "removed", {}
+            elif locale not in previous_translations:
+                change, new_data = "added", translations[locale]
+            elif previous_digests.get(locale) == get_translation_data_digest(translations[locale]):
+                continue
+            else:
+                change, new_data = "modified", translations[locale]
+            # compare values as they are stored in revisions
+            new_data = json.loads(json.dumps(new_data, cls=DjangoJSONEncoder))
+            old_data = previous_translations.get(locale, {})
+            if change == "modified":
+                fields = [name for name in field_names if new_data.get(name) != old_data.get(name)]
+            else:
+                # fields with a value only in an added or removed translation
+                values = new_data or old_data
+                fields = [
+                    name
+                    for name in field_names
+                    if i18n_model._meta.get_field(name).to_python(values.get(name))
+                ]
+            if fields or change != "modified":
+                changes[locale] = {"change": change, "fields": fields}
+        return changes
+
+    def _get_delta_translated_data(self, translations: dict) -> dict:
+        """
+        Return revision data with `translations` of locales changed since the previous revision
+        and references to the revisions storing the unchanged ones
+        """
+        rel_name = self._parler_meta.root_rel_name
+        digests = {
+            locale: get_translation_data_digest(trans_data)
+            for locale, trans_data in translations.items()
+        }
+        refs: Dict[str, int] = {}
+        data = {
+            rel_name: translations,
+            REVISION_DIGESTS_KEY: digests,
+            REVISION_REFS_KEY: refs,
+            REVISION_DEPTH_KEY: 0,
+        }
+        previous = getattr(self, "latest_revision", None) if self.pk else None
+        if previous is None or REVISION_DIGESTS_KEY not in previous.content:
+            return data
+        depth = previous.content.get(REVISION_DEPTH_KEY, 0) + 1
+        if depth >= self.parler_revisions_snapshot_interval:
+            # full snapshot: keeps references close to the revision
+            return data
+        previous_refs = previous.content.get(REVISION_REFS_KEY, {})
+        for locale, digest in digests.items():
+            if previous.content[REVISION_DIGESTS_KEY].get(locale) != digest:
+                continue
+            # locales of the previous revision are either stored or referenced
+            refs[locale] = previous_refs.get(locale, previous.pk)
+            del translations[locale]
+        if refs:
+            data[REVISION_DEPTH_KEY] = depth
+        return data
 
     def save(self, *args: Tuple, **kwargs: Dict) -> None:
         """
@@ -118,11 +582,155 @@ class WagtailParlerModel(TranslatableModel):
             return
         ret = super().save_translations(*args, **kwargs)
         for i18n_model, data in self._translations_cache.items():
-            for locale, translation in data.items():
-                if isinstance(translation, ToDelete):
-                    translation = i18n_model.objects.filter(
-                        language_code=locale, master_id=self.pk
-                    ).first()
-                    if translation:
-                        translation.delete()
+            locales = [
+                locale for locale, translation in data.items() if isinstance(translation, ToDelete)
+            ]
+            if locales:
+                to_delete = list(
+                    i18n_model.objects.filter(language_code__in=locales, master_id=self.pk)
+                )
+                delete_translations(self, i18n_model, to_delete)
+                # sentinels of translations which did not exist anymore
+                for locale in locales:
+                    data[locale] = MISSING
         return ret
+
+
+@receiver(signals.pre_delete, sender=Revision)
+def store_referenced_translations(sender: type, instance: Revision, **kwargs: Any) -> None:
+    """
+    Copy the translations stored by the deleted revision `instance` into the revisions referencing
+    them (see `WagtailParlerModel.parler_delta_revisions`), so they can still be restored.
+    Revisions deleted with the same query are skipped, so are revisions deleted because their
+    object (or its content type) is deleted: all its revisions are deleted.
+    """
+    if REVISION_DIGESTS_KEY not in (instance.content or {}):
+        return
+    origin = kwargs.get("origin")
+    origin_model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    if origin is not None and not issubclass(origin_model, Revision):
+        return
+    model = ContentType.objects.get_for_id(instance.content_type_id).model_class()
+    if model is None or not issubclass(model, WagtailParlerModel):
+        return
+    rel_name = model._parler_meta.root_rel_name
+    translations = load_revision_translations(instance.content.get(rel_name))
+    # references always point to older revisions
+    revisions = Revision.objects.filter(
+        base_content_type_id=instance.base_content_type_id,
+        object_id=instance.object_id,
+        pk__gt=instance.pk,
+    )
+    if isinstance(origin, QuerySet):
+        revisions = revisions.exclude(pk__in=origin.values("pk"))
+    for revision_pk, content in revisions.values_list("pk", "content"):
+        refs = content.get(REVISION_REFS_KEY) or {}
+        locales = [
+            locale for locale, ref in refs.items() if ref == instance.pk and locale in translations
+        ]
+        if not locales:
+            continue
+        stored = content.get(rel_name)
+        revision_translations = dict(load_revision_translations(stored))
+        for locale in locales:
+            revision_translations[locale] = translations[locale]
+            del refs[locale]
+        if isinstance(stored, str) and stored.startswith(COMPRESSED_TRANSLATIONS_PREFIX):
+            content[rel_name] = dump_revision_translations(revision_translations)
+        else:
+            content[rel_name] = revision_translations
+        Revision.objects.filter(pk=revision_pk).update(content=content)
+
+
+class ParlerPreviewCacheMixin:
+    """
+    Mixin for previewable `WagtailParlerModel` (to put before `PreviewableMixin`) serving identical
+    previews from a cache: same previewed locale translation, untranslated fields (and child
+    relations of clusterable models), preview mode, template, user and active language.
+    The rendering must not depend on anything else (CSRF token, session, related objects which
+    are not in the serializable data of the instance…): the HTML rendered for a request is
+    served to later ones.
+    The cache is local to the process and keeps the `preview_cache_size` last used previews (0
+    disables the cache).
+    """
+
+    preview_cache_size = 32
+    _preview_cache: OrderedDict
+    _preview_cache_lock = Lock()
+
+    @classmethod
+    def clear_preview_cache(cls) -> None:
+        cls.__dict__.get("_preview_cache", {}).clear()
+
+    def get_preview_cache_key(
+        self,
+        original_request: Optional[HttpRequest],
+        preview_mode: Optional[str],
+        extra_request_attrs: Optional[Dict] = None,
+    ) -> str:
+        """
+        Return the hash of everything the preview of this instance depends on
+        """
+        locale = self.get_current_language()  # type: ignore
+        try:
+            translation = self._get_translated_model(locale, use_fallback=True)  # type: ignore
+        except self._parler_meta.root.model.DoesNotExist:  # type: ignore
+            translated_data = None
+        else:
+            translated_data = get_serializable_data_for_fields(translation)
+            translated_data.pop("id", None)
+        if isinstance(self, ClusterableModel):
+            data = ClusterableModel.serializable_data(self)
+        else:
+            data = get_serializable_data_for_fields(self)
+        template = self.get_preview_template(original_request, preview_mode)  # type: ignore
+        if not isinstance(template, (str, list, tuple)):
+            # Template object: use its name
+            template = getattr(getattr(template, "origin", None), "name", None) or repr(template)
+        payload = {
+            "model": self._meta.label,  # type: ignore
+            "data": data,
+            "locale": locale,
+            "translation": translated_data,
+            "mode": preview_mode,
+            "template": template,
+            "user": getattr(getattr(original_request, "user", None), "pk", None),
+            # admin UI strings, localized formats…
+            "language": get_language(),
+            "extra": sorted((k, repr(v)) for k, v in (extra_request_attrs or {}).items()),
+        }
+        serialized = json.dumps(payload, sort_keys=True, cls=DjangoJSONEncoder)
+        return hashlib.sha1(serialized.encode()).hexdigest()
+
+    def make_preview_request(
+        self,
+        original_request: Optional[HttpRequest] = None,
+        preview_mode: Optional[str] = None,
+        extra_request_attrs: Optional[Dict] = None,
+    ) -> HttpResponse:
+        if not self.preview_cache_size:
+            return super().make_preview_request(  # type: ignore
+                original_request, preview_mode, extra_request_attrs
+            )
+        cls = self.__class__
+        key = self.get_preview_cache_key(original_request, preview_mode, extra_request_attrs)
+        with self._preview_cache_lock:
+            if "_preview_cache" not in cls.__dict__:
+                cls._preview_cache = OrderedDict()
+            cached: Any = cls._preview_cache.get(key)
+            if cached is not None:
+                cls._preview_cache.move_to_end(key)
+        if cached is None:
+            response = super().make_preview_request(  # type: ignore
+                original_request, preview_mode, extra_request_attrs
+            )
+            if response.status_code != 200 or getattr(response, "streaming", False):
+                return response
+            cached = (response.content, response.status_code, dict(response.headers.items()))
+            with self._preview_cache_lock:
+                cls._preview_cache[key] = cached
+                while len(cls._preview_cache) > self.preview_cache_size:
+                    cls._preview_cache.popitem(last=False)
+            return response
+        content, status, headers = cached
+        return HttpResponse(content, status=status, headers=headers)
@@ -2,6 +2,108 @@ function wagtail_parler_set_current_admin_locale_tab(locale) {
     document.getElementById("wagtail_parler_locale_tab").setAttribute("value", locale);
 }
 
+// true while the edit form is submitted: others FormData (unsaved changes check, preview…)
+// keep the fields of unchanged tabs
+let wagtail_parler_submitting = false;
+
+function wagtail_parler_serialize_locale(form_data, locale) {
+    // serialized values of the fields of `locale`, null if a file is picked: another file may
+    // have the same name, size and date, a picked file is always a change
+    const prefix = `translations_${locale}_`;
+    const values = [];
+    for (const [name, value] of form_data) {
+        if (!name.startsWith(prefix)) {
+            continue;
+        }
+        if (typeof value !== "string" && (value.name || value.size)) {
+            return null;
+        }
+        values.push([name, typeof value === "string" ? value : ""]);
+    }
+    return JSON.stringify(values);
+}
+
+function wagtail_parler_snapshot_tabs(form) {
+    // keep the initial values of the tabs sent only if changed (partial submission)
+    const inputs = form.querySelectorAll("[data-wagtail-parler-partial-locale]");
+    if (!inputs.length) {
+        return;
+    }
+    const form_data = [...new FormData(form)];
+    inputs.forEach((input) => {
+        if (input.wagtail_parler_initial_values === undefined) {
+            input.wagtail_parler_initial_values = wagtail_parler_serialize_locale(
+                form_data,
+                input.dataset.wagtailParlerPartialLocale
+            );
+        }
+    });
+}
+
+function wagtail_parler_remove_unchanged_tabs(event) {
+    // fields of unchanged tabs are not sent, nor their locale in the sent locales
+    if (!wagtail_parler_submitting) {
+        return;
+    }
+    wagtail_parler_submitting = false;
+    const form_data = event.formData;
+    event.target.querySelectorAll("[data-wagtail-parler-partial-locale]").forEach((input) => {
+        const locale = input.dataset.wagtailParlerPartialLocale;
+        const values = wagtail_parler_serialize_locale(form_data, locale);
+        if (
+            values === null ||
+            input.wagtail_parler_initial_values === undefined ||
+            input.wagtail_parler_initial_values !== values
+        ) {
+            return;
+        }
+        const prefix = `translations_${locale}_`;
+        for (const name of new Set(form_data.keys())) {
+            if (name.startsWith(prefix)) {
+                form_data.delete(name);
+            }
+        }
+        const sent_locales = form_data.getAll(input.name).filter((code) => code !== locale);
+        form_data.delete(input.name);
+        sent_locales.forEach((code) => form_data.append(input.name, code));
+    });
+}
+
+function wagtail_parler_start_submit(event) {
+    wagtail_parler_submitting = true;
+    // the submission may be canceled by another listener
+    setTimeout(() => {
+        wagtail_parler_submitting = false;
+    });
+}
+
+function wagtail_parler_load_lazy_tab(locale) {
+    // replace the placeholder of a lazy loaded tab by its content
+    const placeholder = document.querySelector(`[data-wagtail-parler-lazy-tab="${locale}"]`);
+    if (!placeholder || placeholder.wagtail_parler_loading) {
+        return;
+    }
+    placeholder.wagtail_parler_loading = true;
+    fetch(placeholder.dataset.wagtailParlerUrl, { credentials: "same-origin" })
+        .then((response) => {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            return response.text();
+        })
+        .then((html) => {
+            const form = placeholder.closest("form");
+            placeholder.replaceWith(document.createRange().createContextualFragment(html));
+            if (form) {
+                // let widgets of the loaded tab initialize their values first
+                setTimeout(() => wagtail_parler_snapshot_tabs(form));
+            }
+        })
+        .catch(() => {
+            placeholder.wagtail_parler_loading = false;
+        });
+}
+
 window.addEventListener('DOMContentLoaded', (event) => {
     const store_current_edited_language = (mutationList, observer) => {
         for (const mutation of mutationList) {
@@ -11,6 +113,9 @@ window.addEventListener('DOMContentLoaded', (event) => {
             if (mutation.target.ariaSelected) {
                 wagtail_parler_set_current_admin_locale_tab(mutation.target.wagtail_parler_locale);
             }
+            if (mutation.target.ariaSelected === "true") {
+                wagtail_parler_load_lazy_tab(mutation.target.wagtail_parler_locale);
+            }
         }
     };
     const tabs_links = document.querySelectorAll(".w-tabs__tab[id^='tab-label-parler_translations_']");
@@ -24,6 +129,9 @@ window.addEventListener('DOMContentLoaded', (event) => {
         locale_tab_input.setAttribute("type", "hidden");
         locale_tab_input.setAttribute("id", "wagtail_parler_locale_tab");
         form.appendChild(locale_tab_input);
+        form.addEventListener("submit", wagtail_parler_start_submit);
+        form.addEventListener("formdata", wagtail_parler_remove_unchanged_tabs);
+        window.addEventListener("load", () => wagtail_parler_snapshot_tabs(form));
         tabs_links.forEach((target) => {
             if (target.id.startsWith("tab-label-parler_translations_")) {
                 with_parler_tabs = true;
@@ -31,6 +139,9 @@ window.addEventListener('DOMContentLoaded', (event) => {
                 if (target.ariaSelected) {
                     wagtail_parler_set_current_admin_locale_tab(target.wagtail_parler_locale);
                 }
+                if (target.ariaSelected === "true") {
+                    wagtail_parler_load_lazy_tab(target.wagtail_parler_locale);
+                }
                 let observer = new MutationObserver(store_current_edited_language);
                 observer.observe(target, { attributes: true, childList: false, subtree: false });
             }
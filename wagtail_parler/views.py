@@ -0,0 +1,187 @@
+# Future imports
+from __future__ import annotations
+
+# Standard libs
+import base64
+import json
+from typing import TYPE_CHECKING
+import zlib
+
+if TYPE_CHECKING:
+    from typing import Any
+    from typing import Optional
+    from typing import Tuple
+
+    from django.forms import BaseForm
+    from django.http import HttpRequest
+
+# Django imports
+from django.conf import settings
+from django.http import Http404
+from django.http import HttpResponse
+from django.http import QueryDict
+from django.views.generic import View
+
+# Third Party
+from wagtail.admin.views.generic import models as generic_models
+from wagtail.admin.views.generic.mixins import RevisionsRevertMixin
+from wagtail.admin.views.generic.preview import PreviewOnEdit
+
+# prefix of the compressed preview data stored in the session
+COMPRESSED_PREVIEW_DATA_PREFIX = "zlib:"
+# views whose form is filled with data which are not the current ones
+_NOT_CURRENT_DATA_VIEWS: Tuple = (RevisionsRevertMixin,)
+if hasattr(generic_models, "CopyViewMixin"):  # wagtail >= 6
+    _NOT_CURRENT_DATA_VIEWS += (generic_models.CopyViewMixin,)
+
+
+class ParlerLocalesViewMixin:
+    """
+    Build the edit form with fields of the locales the user may edit and picked only
+    """
+
+    # ParlerSnippetAdminMixin instance (ModelAdmin views use their `model_admin`)
+    parler_admin: Any = None
+    parler_locales_data: Optional[QueryDict] = None
+
+    def get_parler_admin(self) -> Any:
+        return self.parler_admin or self.model_admin  # type: ignore
+
+    def get_panel(self) -> Any:
+        # the edit handler of the admin may have been rebuilt since urls were built
+        return self.get_parler_admin().get_edit_handler()
+
+    def get_edit_handler(self) -> Any:
+        # ModelAdmin views: the edit handler is built and bound once by the admin
+        return self.get_parler_admin().get_edit_handler()
+
+    def get_form_class(self) -> type:
+        admin = self.get_parler_admin()
+        form_class = admin.get_parler_edit_form_class()
+        request = self.request  # type: ignore
+        data = self.parler_locales_data
+        if data is None:
+            data = request.POST if request.method == "POST" else request.GET
+        return admin.get_parler_form_class(form_class, request, data)
+
+    def get_object(self, *args: Any, **kwargs: Any) -> Any:
+        obj = super().get_object(*args, **kwargs)  # type: ignore
+        if isinstance(self, RevisionsRevertMixin) and not hasattr(self, "parler_current_object"):
+            # the reverted object is built from the revision of the current one
+            self.parler_current_object = obj
+        return obj
+
+    def get_form(self, *args: Any, **kwargs: Any) -> BaseForm:
+        form = super().get_form(*args, **kwargs)  # type: ignore
+        if isinstance(self, _NOT_CURRENT_DATA_VIEWS):
+            # tabs loaded on demand would show the current translations instead of the reverted
+            # (or copied) ones
+            form.parler_lazy_tabs = False
+        if isinstance(self, RevisionsRevertMixin) and hasattr(form, "keep_current_translations"):
+            # only translations of the locales of the form are reverted
+            form.keep_current_translations(self.parler_current_object)
+        return form
+
+
+class ParlerLocalesPreviewMixin(ParlerLocalesViewMixin):
+    """
+    Build the preview form with fields of the previewed locale (and its fallbacks) the user may
+    edit and picked only
+    """
+
+    def get_form_class(self) -> type:
+        form_class = super().get_form_class()
+        if hasattr(form_class, "for_preview") and self.parler_locales_data is not None:
+            # only the previewed locale (and its fallbacks) is validated and built
+            form_class = form_class.for_preview(self.parler_locales_data)
+        return form_class
+
+    def get_form(self, query_dict: QueryDict) -> BaseForm:
+        # preview data is read from the session on GET requests
+        self.parler_locales_data = query_dict
+        return super().get_form(query_dict)  # type: ignore
+
+    def post(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+        response = super().post(request, *args, **kwargs)  # type: ignore
+        trim = getattr(self.parler_admin, "parler_trim_preview_session", False)
+        compress = getattr(self.parler_admin, "parler_compress_preview_session", False)
+        session_key = self.session_key  # type: ignore
+        stored = request.session.get(session_key)
+        if (trim or compress) and stored and json.loads(response.content)["is_valid"]:
+            request.session[session_key] = (
+                self.dump_preview_data(request.POST, trim, compress),
+                stored[1],
+            )
+        return response
+
+    def dump_preview_data(self, data: QueryDict, trim: bool, compress: bool) -> str:
+        """
+        Serialize preview `data` to store it in the session: without fields of the locales not
+        previewed if `trim` (they are read from the database), compressed if `compress`
+        """
+        if trim:
+            self.parler_locales_data = data
+            previewed = getattr(self.get_form_class(), "parler_locales", None)
+            if previewed is not None:
+                prefixes = tuple(
+                    "translations_%s_" % conf["code"]
+                    for conf in settings.PARLER_LANGUAGES[None]
+                    if conf["code"] not in previewed
+                )
+                data = data.copy()
+                for key in [key for key in data if key.startswith(prefixes)]:
+                    del data[key]
+        serialized = data.urlencode()
+        if compress:
+            compressed = base64.b64encode(zlib.compress(serialized.encode())).decode()
+            serialized = COMPRESSED_PREVIEW_DATA_PREFIX + compressed
+        return serialized
+
+    def _get_data_from_session(self) -> QueryDict:
+        post_data, _ = self.request.session.get(self.session_key, (None, None))  # type: ignore
+        if isinstance(post_data, str) and post_data.startswith(COMPRESSED_PREVIEW_DATA_PREFIX):
+            compressed = post_data.removeprefix(COMPRESSED_PREVIEW_DATA_PREFIX)
+            return QueryDict(zlib.decompress(base64.b64decode(compressed)).decode())
+        return super()._get_data_from_session()  # type: ignore
+
+
+def get_parler_view_class(view_class: type, **attrs: Any) -> type:
+    """
+    Return `view_class` extended to build the edit form of the locales the user may edit and
+    picked only, with `attrs` set on the returned class
+    """
+    if issubclass(view_class, ParlerLocalesViewMixin):
+        if not attrs:
+            return view_class
+        bases: Tuple = (view_class,)
+    elif issubclass(view_class, PreviewOnEdit):
+        bases = (ParlerLocalesPreviewMixin, view_class)
+    else:
+        bases = (ParlerLocalesViewMixin, view_class)
+    return type(view_class.__name__, bases, attrs)
+
+
+class TranslationsTabView(View):
+    """
+    Render the tab of one locale of an edit form whose translations tabs are lazy loaded
+    """
+
+    http_method_names = ["get"]
+    # ParlerModelAdminMixin or ParlerSnippetAdminMixin instance
+    admin: Any = None
+
+    def get(self, request: HttpRequest, locale: str, pk: Optional[str] = None) -> HttpResponse:
+        instance = self.admin.get_parler_translations_instance(request, pk)
+        edit_handler = self.admin.get_edit_handler()
+        form_class = self.admin.get_parler_form_class(
+            self.admin.get_parler_edit_form_class(), request, request.GET
+        )
+        if locale not in getattr(form_class, "parler_locales", ()):
+            raise Http404
+        form = form_class(instance=instance, for_user=request.user)
+        bound_panel = edit_handler.get_bound_panel(instance=instance, request=request, form=form)
+        for child in bound_panel.children:
+            if getattr(child, "parler_locale", None) == locale:
+                child.is_deferred = False
+                return HttpResponse(child.render_html())
+        raise Http404
@@ -16,6 +16,7 @@ from wagtail.models import PreviewableMixin
 from wagtail.models import RevisionMixin
 
 # wagtail / parler
+from wagtail_parler.models import ParlerPreviewCacheMixin
 from wagtail_parler.models import WagtailParlerModel
 
 
@@ -72,8 +73,10 @@ class BaseFood(RevisionMixin, PreviewableMixin, WagtailParlerModel):
         return "wagtail_parler_tests/food_preview.html"
 
 
-class Food(BaseFood):
+class Food(ParlerPreviewCacheMixin, BaseFood):
     translations = TranslatedFields(**BaseFood.translations)
+    # previews are cached in the tests of the cache only
+    preview_cache_size = 0
 
     class Meta:
         verbose_name = _("Nourriture - auto edit handlers")
@@ -2,30 +2,83 @@
 from __future__ import annotations
 
 # Standard libs
+import base64
+from contextlib import ExitStack
+from contextlib import contextmanager
+import inspect
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Union
+from unittest import mock
+import zlib
 
 # Django imports
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.auth.models import Group
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Model
+from django.db.models.signals import post_delete
+from django.forms import Textarea
 from django.http import HttpResponse
+from django.http import QueryDict
+from django.template.loader import get_template
 from django.test import Client
+from django.test import RequestFactory
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.test.utils import override_settings
+from django.urls import resolve
+from django.urls import reverse
+from django.utils.functional import Promise
 from django.utils.translation import gettext_lazy as _
+from django.utils.translation import override as override_language
 
 # Third Party
 from bs4 import BeautifulSoup
 from bs4 import NavigableString
 from bs4 import Tag
 from wagtail import VERSION as WAGTAIL_VERSION
+from wagtail.admin.panels import FieldPanel
+from wagtail.admin.panels import HelpPanel
+from wagtail.admin.panels import MultiFieldPanel
+from wagtail.admin.panels import ObjectList
+from wagtail.admin.panels import TabbedInterface
+from wagtail.models import Revision
+from wagtail_modeladmin.options import ModelAdmin
 
 # wagtail / parler
+from wagtail_parler.forms import EMPTINESS_DETECTORS
+from wagtail_parler.forms import build_translations_form
+from wagtail_parler.forms import is_empty_rich_text
+from wagtail_parler.forms import is_empty_stream
+from wagtail_parler.forms import is_empty_text
+from wagtail_parler.forms import register_emptiness_detector
+from wagtail_parler.handlers import TranslationsList
+from wagtail_parler.handlers import UnchangedFieldComparison
+from wagtail_parler.handlers import clear_edit_handlers_cache
+from wagtail_parler.models import TO_DELETE
+from wagtail_parler.models import can_bulk_delete_translations
+from wagtail_parler.models import can_bulk_save_translations
+from wagtail_parler.models import filter_revisions_by_locale
+from wagtail_parler.models import get_revisions_changes
+from wagtail_parler.models import get_translated_languages
+from wagtail_parler.models import load_translations
+from wagtail_parler.models import store_referenced_translations
 from wagtail_parler_tests.models import Food
+from wagtail_parler_tests.models import FoodWithEditHandler
+from wagtail_parler_tests.models import FoodWithEmptyEditHandler
+from wagtail_parler_tests.models import FoodWithSpecificEditHandler
 from wagtail_parler_tests.models import WeirdFood
 
-__all__ = ["WagtailParlerModelAdminTests", "WagtailParlerSnippetsTests"]
+__all__ = [
+    "WagtailParlerModelAdminTests",
+    "WagtailParlerSnippetsTests",
+    "WagtailParlerEditHandlerTests",
+]
 
 RecusiveListStrOrTuple = List[Union[str, Tuple[str, "RecusiveListStrOrTuple"]]]
 
@@ -114,6 +167,7 @@ class WagtailParlerBaseTests:
     def setUp(self: TestCase) -> None:
         self.client = Client(enforce_csrf_checks=False)
         self.client.login(username="admin", password="admin")
+        Food.clear_preview_cache()
         return super().setUp()
 
     def _check_tabs(self: TestCase, soup: BeautifulSoup, expected_tabs: List[str]) -> None:
@@ -205,6 +259,24 @@ class WagtailParlerBaseTests:
                 url += "%d/" % pk
         return url
 
+    def _create_gely(self, model: type, **names: str) -> Model:
+        """
+        Create the gely of `model` translated in the locales of `names` (see `_set_gely_names`)
+        """
+        gely = model(slug=GELY_DATA[None]["slug"], yum_rating=GELY_DATA[None]["yum_rating"])
+        self._set_gely_names(gely, **names)
+        gely.save()
+        return gely
+
+    def _set_gely_names(self, gely: Model, **names: str) -> None:
+        """
+        Set the translations of `gely` by locale: the name of `names`, summary and content from it
+        """
+        for locale, name in names.items():
+            gely.set_current_language(locale)  # type: ignore
+            gely.name = name  # type: ignore
+            gely.summary = gely.content = "%s content" % name  # type: ignore
+
     def _get_soup(self: TestCase, path, expected_status: int = 200) -> BeautifulSoup:
         resp = self.client.get(path)
         assert isinstance(resp, HttpResponse)
@@ -517,6 +589,150 @@ class WagtailParlerBaseTests:
             },
         )
 
+    def test_lazy_tabs(self: TestCase) -> None:
+        """checks only the default locale tab is rendered and others are loaded on demand"""
+        add_url = self._get_admin_url("wagtail_parler_tests", "foodwithedithandler", "add")
+        soup = self._get_soup(add_url)
+        self.assertIsNotNone(soup.find("input", {"name": "translations_fr_name"}))
+        self.assertIsNone(soup.find("input", {"name": "translations_en_name"}))
+        placeholder = soup.find(attrs={"data-wagtail-parler-lazy-tab": "en"})
+        self.assertIsNotNone(placeholder.find("input", {"value": "en"}))
+        # the tab is rendered with the form class cached by the admin
+        with mock.patch.object(
+            TabbedInterface, "get_form_class", side_effect=AssertionError("form class rebuilt")
+        ):
+            soup = self._get_soup(placeholder["data-wagtail-parler-url"])
+        self.assertIsNotNone(soup.find("input", {"name": "translations_en_name"}))
+        self.assertIsNone(soup.find("input", {"name": "translations_fr_name"}))
+
+        jelly = self._create_gely(FoodWithEditHandler, fr="Gelée", en="Jelly")
+        edit_url = self._get_admin_url(
+            "wagtail_parler_tests", "foodwithedithandler", "edit", jelly.pk
+        )
+        soup = self._get_soup(edit_url)
+        placeholder = soup.find(attrs={"data-wagtail-parler-lazy-tab": "en"})
+        soup = self._get_soup(placeholder["data-wagtail-parler-url"])
+        self.assertEqual(soup.find("input", {"name": "translations_en_name"})["value"], "Jelly")
+
+        # never opened tabs are left untouched
+        data = {
+            **GELY_DATA[None],
+            **GELY_DATA["fr"],
+            "translations_fr_name": "",
+            "wagtail_parler_unloaded_locales": ["en", "es"],
+        }
+        resp = self.client.post(edit_url, data)
+        soup = BeautifulSoup(resp.content, "html.parser")
+        self.assertIsNotNone(soup.find(attrs={"data-wagtail-parler-lazy-tab": "en"}))
+        data["translations_fr_name"] = "Gelée updated"
+        resp = self.client.post(edit_url, data)
+        self.assertEqual(resp.status_code, 302)
+        jelly = FoodWithEditHandler.objects.get()
+        self.assertEqual(jelly.get_translation("fr").name, "Gelée updated")
+        self.assertEqual(jelly.get_translation("en").name, "Jelly")
+        self.assertEqual(set(jelly.get_available_languages()), {"fr", "en"})
+
+    def test_partial_submit(self: TestCase) -> None:
+        """checks translations of locales missing from the sent locales are left untouched"""
+        jelly = self._create_gely(FoodWithEditHandler, fr="Gelée", en="Jelly")
+        edit_url = self._get_admin_url(
+            "wagtail_parler_tests", "foodwithedithandler", "edit", jelly.pk
+        )
+        soup = self._get_soup(edit_url)
+        sent_input = soup.find("input", {"name": "wagtail_parler_sent_locales"})
+        self.assertEqual(sent_input["value"], "fr")
+        self.assertFalse(sent_input.has_attr("data-wagtail-parler-partial-locale"))
+        placeholder = soup.find(attrs={"data-wagtail-parler-lazy-tab": "en"})
+        soup = self._get_soup(placeholder["data-wagtail-parler-url"])
+        sent_input = soup.find("input", {"name": "wagtail_parler_sent_locales"})
+        self.assertEqual(sent_input["data-wagtail-parler-partial-locale"], "en")
+
+        # the en tab was loaded but is unchanged: its fields and locale are not sent
+        data = {
+            **GELY_DATA[None],
+            **GELY_DATA["fr"],
+            "translations_fr_name": "Gelée updated",
+            "wagtail_parler_sent_locales": ["fr"],
+        }
+        resp = self.client.post(edit_url, data)
+        self.assertEqual(resp.status_code, 302)
+        jelly = FoodWithEditHandler.objects.get()
+        self.assertEqual(jelly.get_translation("fr").name, "Gelée updated")
+        self.assertEqual(jelly.get_translation("en").name, "Jelly")
+        self.assertEqual(set(jelly.get_available_languages()), {"fr", "en"})
+
+        # after an invalid submission, pending changes are sent again even if left unchanged
+        resp = self.client.post(
+            edit_url,
+            {
+                **data,
+                **GELY_DATA["en"],
+                "translations_fr_name": "",
+                "translations_en_name": "Jelly edited",
+                "wagtail_parler_sent_locales": ["fr", "en"],
+            },
+        )
+        self.assertEqual(resp.status_code, 200)
+        soup = BeautifulSoup(resp.content, "html.parser")
+        self.assertEqual(
+            soup.find("input", {"name": "translations_en_name"})["value"], "Jelly edited"
+        )
+        sent_inputs = soup.find_all("input", {"name": "wagtail_parler_sent_locales"})
+        self.assertEqual([sent_input["value"] for sent_input in sent_inputs], ["fr", "en"])
+        self.assertIsNone(soup.find(attrs={"data-wagtail-parler-partial-locale": True}))
+
+    def test_locales_picker(self: TestCase) -> None:
+        """checks only the default locale and the picked ones are edited"""
+        jelly = self._create_gely(FoodWithEmptyEditHandler, fr="Gelée", en="Jelly", es="Jalea")
+        edit_url = self._get_admin_url(
+            "wagtail_parler_tests", "foodwithemptyedithandler", "edit", jelly.pk
+        )
+        soup = self._get_soup(edit_url)
+        self._check_tabs(soup, ["Score de miam", "fr: French 🟢", "Régime"])
+        self.assertIsNone(soup.find("input", {"name": "translations_en_name"}))
+        picker_links = soup.select(".wagtail-parler-locales-picker a")
+        self.assertEqual([link.text for link in picker_links], ["English", "Spanish"])
+
+        soup = self._get_soup(edit_url + picker_links[0]["href"])
+        self._check_tabs(soup, ["Score de miam", "fr: French 🟢", "en: English 🟢", "Régime"])
+        self.assertEqual(soup.find("input", {"name": "translations_en_name"})["value"], "Jelly")
+        self.assertIsNone(soup.find("input", {"name": "translations_es_name"}))
+
+        # translations of locales not picked are left untouched
+        data = {
+            **GELY_DATA[None],
+            **GELY_DATA["fr"],
+            **GELY_DATA["en"],
+            "translations_en_name": "Jelly updated",
+            "wagtail_parler_locales": ["fr", "en"],
+        }
+        resp = self.client.post(edit_url, data)
+        self.assertEqual(resp.status_code, 302)
+        jelly = FoodWithEmptyEditHandler.objects.get()
+        self.assertEqual(jelly.get_translation("en").name, "Jelly updated")
+        self.assertEqual(jelly.get_translation("es").name, "Jalea")
+
+    def test_user_locales(self: TestCase) -> None:
+        """checks translators edit only their languages"""
+        jelly = self._create_gely(FoodWithSpecificEditHandler, fr="Gelée", en="Jelly", es="Jalea")
+        group = Group.objects.create(name="translators_en")
+        User.objects.get(username="admin").groups.add(group)
+        edit_url = self._get_admin_url(
+            "wagtail_parler_tests", "foodwithspecificedithandler", "edit", jelly.pk
+        )
+        soup = self._get_soup(edit_url)
+        self._check_tabs(soup, ["Slug", "Score de miam", "en: English 🟢", "Régime"])
+        self.assertIsNone(soup.find("input", {"name": "translations_fr_name"}))
+
+        # translations of others languages are left untouched
+        data = {**GELY_DATA[None], **GELY_DATA["en"], "translations_en_name": "Jelly updated"}
+        resp = self.client.post(edit_url, data)
+        self.assertEqual(resp.status_code, 302)
+        jelly = FoodWithSpecificEditHandler.objects.get()
+        self.assertEqual(jelly.get_translation("en").name, "Jelly updated")
+        self.assertEqual(jelly.get_translation("fr").name, "Gelée")
+        self.assertEqual(jelly.get_translation("es").name, "Jalea")
+
 
 class WagtailParlerModelAdminTests(WagtailParlerBaseTests, TestCase):
     admin_interface = "modeladmin"
@@ -540,6 +756,70 @@ class WagtailParlerSnippetsTests(WagtailParlerBaseTests, TestCase):
         langs = [lang.text.strip() for lang in untranslated]
         self.assertEqual(langs, ["EN", "ES"])
 
+    def test_user_locales_in_revert_view(self) -> None:
+        """checks translators revert only translations of their languages"""
+        jelly = self._create_gely(FoodWithSpecificEditHandler, fr="Gelée", en="Jelly")
+        revision = jelly.save_revision()
+        self._set_gely_names(jelly, fr="Gelée v2", en="Jelly v2", es="Jalea")
+        jelly.save()
+        jelly.save_revision()
+        group = Group.objects.create(name="translators_en")
+        User.objects.get(username="admin").groups.add(group)
+        viewset = FoodWithSpecificEditHandler.snippet_viewset
+        revert_url = reverse(
+            viewset.get_url_name("revisions_revert"), args=[jelly.pk, revision.pk]
+        )
+        soup = self._get_soup(revert_url)
+        self.assertEqual(soup.find("input", {"name": "translations_en_name"})["value"], "Jelly")
+        self.assertIsNone(soup.find("input", {"name": "translations_fr_name"}))
+        resp = self.client.post(revert_url, {**GELY_DATA[None], **GELY_DATA["en"]})
+        self.assertEqual(resp.status_code, 302)
+        jelly = FoodWithSpecificEditHandler.objects.get()
+        self.assertEqual(jelly.get_translation("en").name, "Jelly")
+        # translations of others languages are neither reverted nor deleted
+        self.assertEqual(jelly.get_translation("fr").name, "Gelée v2")
+        self.assertEqual(jelly.get_translation("es").name, "Jalea")
+        content = jelly.latest_revision.content[jelly._parler_meta.root_rel_name]
+        self.assertEqual(content["fr"]["name"], "Gelée v2")
+        self.assertEqual(content["es"]["name"], "Jalea")
+
+    def test_lazy_tabs_with_locales_picker(self) -> None:
+        """checks tabs of the picked locales are loaded on demand"""
+        jelly = self._create_gely(FoodWithEditHandler, en="Jelly")
+        viewset = FoodWithEditHandler.snippet_viewset
+        edit_url = reverse(viewset.get_url_name("edit"), args=[jelly.pk])
+        clear_edit_handlers_cache("PARLER_LANGUAGES")
+        try:
+            with mock.patch.object(viewset, "parler_locales_picker", True):
+                soup = self._get_soup(edit_url + "?wagtail_parler_locales=en")
+                placeholder = soup.find(attrs={"data-wagtail-parler-lazy-tab": "en"})
+                resp = self.client.get(placeholder["data-wagtail-parler-url"])
+        finally:
+            clear_edit_handlers_cache("PARLER_LANGUAGES")
+        self.assertEqual(resp.status_code, 200)
+        soup = BeautifulSoup(resp.content, "html.parser")
+        self.assertEqual(soup.find("input", {"name": "translations_en_name"})["value"], "Jelly")
+
+    def test_lazy_tabs_in_revert_and_copy_views(self) -> None:
+        """checks tabs of all locales are rendered with the reverted or copied translations"""
+        jelly = self._create_gely(FoodWithEditHandler, fr="Gelée", en="Jelly")
+        revision = jelly.save_revision()
+        jelly.name = "Jelly updated"
+        jelly.save()
+        jelly.save_revision()
+        viewset = FoodWithEditHandler.snippet_viewset
+        revert_url = reverse(
+            viewset.get_url_name("revisions_revert"), args=[jelly.pk, revision.pk]
+        )
+        urls = [(revert_url, "Jelly")]
+        if WAGTAIL_VERSION >= (6, 0):  # snippets can be copied since wagtail 6
+            urls.append((reverse(viewset.get_url_name("copy"), args=[jelly.pk]), "Jelly updated"))
+        for url, name in urls:
+            soup = self._get_soup(url)
+            self.assertIsNone(soup.find(attrs={"data-wagtail-parler-lazy-tab": "en"}))
+            self.assertEqual(soup.find("input", {"name": "translations_en_name"})["value"], name)
+            self.assertIsNone(soup.find(attrs={"data-wagtail-parler-partial-locale": True}))
+
     def test_preview_locale_dependent_update_existing(self) -> None:
         """checks that preview display correct localized version of the instance"""
         jelly = Food.objects.get(pk=1)
@@ -604,6 +884,104 @@ class WagtailParlerSnippetsTests(WagtailParlerBaseTests, TestCase):
         self.assertEqual(jelly.get_translation("fr").name, "Gelée")
         self.assertEqual(set(jelly.get_available_languages()), {"fr", "en"})
 
+    def test_preview_locale_only(self) -> None:
+        """checks only the previewed locale and its fallbacks are validated and built"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        es_form_class = form_class.for_preview(QueryDict("wagtail_parler_locale_tab=es"))
+        self.assertEqual(es_form_class.parler_locales, ["fr", "es"])
+        self.assertIs(
+            form_class.for_preview(QueryDict("wagtail_parler_locale_tab=es")), es_form_class
+        )
+        self.assertIs(form_class.for_preview(QueryDict()), form_class)
+
+        jelly = Food.objects.get(pk=1)
+        preview_url = self._get_admin_url("wagtail_parler_tests", "food", "preview", jelly.pk)
+        data = {
+            **GELY_DATA[None],
+            **GELY_DATA["fr"],
+            **GELY_DATA["es"],
+            "translations_en_name": "Jelly" * 100,  # too long: not validated
+            "translations_en_qa-count": 0,
+            "wagtail_parler_locale_tab": "es",
+        }
+        resp = self.client.post(preview_url, data)
+        self.assertTrue(resp.json()["is_valid"])
+        resp = self.client.get(preview_url, data)
+        self.assertContains(resp, "<h1>Jelly ES</h1>", count=1, status_code=200)
+        data["wagtail_parler_locale_tab"] = "en"
+        resp = self.client.post(preview_url, data)
+        self.assertFalse(resp.json()["is_valid"])
+
+    def test_preview_cache(self) -> None:
+        """checks identical previews are rendered once"""
+        jelly = Food.objects.get(pk=1)
+        preview_url = self._get_admin_url("wagtail_parler_tests", "food", "preview", jelly.pk)
+        data = {
+            **GELY_DATA[None],
+            **GELY_DATA["fr"],
+            **GELY_DATA["en"],
+            "wagtail_parler_locale_tab": "fr",
+        }
+        with mock.patch.object(Food, "preview_cache_size", 32), mock.patch.object(
+            Food, "serve_preview", autospec=True, side_effect=Food.serve_preview
+        ) as serve:
+            for name in ("Jelly updated", "Jelly updated again"):
+                # changes of others locales do not change the preview
+                data["translations_en_name"] = name
+                self.client.post(preview_url, data)
+                resp = self.client.get(preview_url)
+                self.assertContains(resp, "<h1>Gelée</h1>", count=1, status_code=200)
+            self.assertEqual(serve.call_count, 1)
+            data["translations_fr_name"] = "Gelée modifiée"
+            self.client.post(preview_url, data)
+            resp = self.client.get(preview_url)
+            self.assertContains(resp, "<h1>Gelée modifiée</h1>", count=1, status_code=200)
+            self.assertEqual(serve.call_count, 2)
+
+    def test_preview_cache_with_template_objects(self) -> None:
+        """checks previews using templates objects or lists of templates are cached"""
+        jelly = Food.objects.get(pk=1)
+        template_name = "wagtail_parler_tests/food_preview.html"
+        for template in ([template_name], get_template(template_name)):
+            with mock.patch.object(Food, "preview_cache_size", 32), mock.patch.object(
+                Food, "get_preview_template", return_value=template
+            ):
+                first = jelly.make_preview_request()
+                self.assertContains(first, "<h1>Gelée</h1>", count=1)
+                self.assertEqual(jelly.make_preview_request().content, first.content)
+        # template objects are identified by their name
+        keys = []
+        for _i in range(2):
+            template = get_template(template_name)
+            with mock.patch.object(Food, "get_preview_template", return_value=template):
+                keys.append(jelly.get_preview_cache_key(None, None))
+        self.assertEqual(keys[0], keys[1])
+        # previews rendered in another language (admin UI strings…) are not shared
+        with override_language("es"):
+            self.assertNotEqual(jelly.get_preview_cache_key(None, None), keys[0])
+
+    def test_preview_session_data(self) -> None:
+        """checks preview data of the previewed locale only are stored compressed in session"""
+        jelly = Food.objects.get(pk=1)
+        preview_url = self._get_admin_url("wagtail_parler_tests", "food", "preview", jelly.pk)
+        data = {
+            **GELY_DATA[None],
+            **GELY_DATA["fr"],
+            **GELY_DATA["en"],
+            **GELY_DATA["es"],
+            "wagtail_parler_locale_tab": "en",
+        }
+        self.client.post(preview_url, data)
+        session_data = self.client.session["wagtail-preview-wagtail_parler_tests-food-1"][0]
+        self.assertTrue(session_data.startswith("zlib:"))
+        stored = QueryDict(zlib.decompress(base64.b64decode(session_data[5:])).decode())
+        self.assertEqual(stored["translations_en_name"], "Jelly")
+        self.assertEqual(stored["translations_fr_name"], "Gelée")
+        self.assertNotIn("translations_es_name", stored)
+        self.assertEqual(stored["yum_rating"], "3")
+        resp = self.client.get(preview_url)
+        self.assertContains(resp, "<h1>Jelly</h1>", count=1, status_code=200)
+
     def test_preview_locale_dependent_new_translation(self) -> None:
         """checks that preview display correct localized version of the instance"""
         jelly = Food.objects.get(pk=1)
@@ -748,3 +1126,624 @@ class WagtailParlerSnippetsTests(WagtailParlerBaseTests, TestCase):
             'Content <span class="deletion">EN</span><span class="addition">FR</span>',
             count=1,
         )
+
+
+class WagtailParlerEditHandlerTests(TestCase):
+    fixtures = ["test_fixtures.json"]
+
+    def _get_model_admin(self, model_name: str) -> ModelAdmin:
+        url = reverse(f"wagtail_parler_tests_{model_name}_modeladmin_index")
+        return inspect.unwrap(resolve(url).func).__self__  # type: ignore
+
+    @contextmanager
+    def _own_translated_fields(self, model: type) -> Iterator[None]:
+        """
+        Make the translations model of `model` own the translated fields it shares with the others
+        foods models, so its translations can be saved in bulk
+        """
+        i18n_model = model._parler_meta.root_model  # type: ignore
+        with ExitStack() as stack:
+            for field in i18n_model._meta.concrete_fields:
+                stack.enter_context(mock.patch.object(field, "model", i18n_model))
+            yield
+
+    def test_edit_handler_is_cached(self) -> None:
+        """checks edit handler is built once per languages configuration"""
+        viewset = Food.snippet_viewset
+        edit_handler = viewset.get_edit_handler()
+        self.assertIs(viewset.get_edit_handler(), edit_handler)
+        self.assertIs(viewset.get_edit_handler().base_form_class, edit_handler.base_form_class)
+        with override_settings(**EXTRA_SETTINGS["CUSTOM_TABS_LABELS"]):
+            self.assertIsNot(viewset.get_edit_handler(), edit_handler)
+        self.assertIsNot(viewset.get_edit_handler(), edit_handler)
+        # views built with the previous edit handler use the new one
+        edit_view = resolve(reverse(viewset.get_url_name("edit"), args=[1])).func
+        view = edit_view.view_class(**edit_view.view_initkwargs)
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        view.setup(request, pk="1")
+        self.assertIs(view.panel, viewset.get_edit_handler())
+        self.assertIs(view.get_form_class(), viewset.get_parler_edit_form_class())
+
+    def test_modeladmin_edit_handler_is_cached(self) -> None:
+        """checks edit handler of a ModelAdmin is bound and built once per configuration"""
+        admin = self._get_model_admin("food")
+        edit_handler = admin.get_edit_handler()
+        self.assertIs(edit_handler.model, Food)
+        self.assertIs(admin.get_edit_handler(), edit_handler)
+        self.assertIs(admin.get_parler_edit_form_class(), admin.get_parler_edit_form_class())
+        with override_settings(**EXTRA_SETTINGS["CUSTOM_TABS_LABELS"]):
+            self.assertIsNot(admin.get_edit_handler(), edit_handler)
+        # views use the edit handler and form class cached by the admin
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+        view = admin.edit_view_class(model_admin=admin, instance_pk="1")
+        view.setup(request)
+        self.assertIs(view.edit_handler, admin.get_edit_handler())
+        self.assertIs(view.get_form_class(), admin.get_parler_edit_form_class())
+
+    def test_translations_handlers_share_untranslated_panels(self) -> None:
+        """checks panels without translated fields are shared between locales tabs"""
+        help_panel = HelpPanel(content="Some help")
+        untranslated_panel = MultiFieldPanel(children=[FieldPanel("slug")])
+        base_handler = TranslationsList(
+            children=[FieldPanel("name"), help_panel, untranslated_panel]  # type: ignore
+        )
+        viewset = Food.snippet_viewset
+        clear_edit_handlers_cache("PARLER_LANGUAGES")
+        try:
+            with mock.patch.object(
+                viewset, "edit_handler", ObjectList(children=[base_handler]), create=True
+            ):
+                edit_handler = viewset.get_edit_handler()
+        finally:
+            clear_edit_handlers_cache("PARLER_LANGUAGES")
+        handlers = [
+            child for child in edit_handler.children if isinstance(child, TranslationsList)
+        ]
+        self.assertEqual(
+            [handler.children[0].field_name for handler in handlers],
+            ["translations_fr_name", "translations_en_name", "translations_es_name"],
+        )
+        # shared panels are bound once for all locales
+        bound_help_panel, bound_untranslated_panel = handlers[0].children[1:]
+        self.assertIs(bound_help_panel.model, Food)
+        self.assertIs(bound_untranslated_panel.children[0].model, Food)
+        for handler in handlers:
+            self.assertIs(handler.children[1], bound_help_panel)
+            self.assertIs(handler.children[2], bound_untranslated_panel)
+        # the template is left untouched
+        self.assertEqual(base_handler.children[0].field_name, "name")
+        self.assertIsNone(help_panel.model)
+
+    @override_settings(**EXTRA_SETTINGS["CUSTOM_TABS_LABELS"])
+    def test_translations_status_resolved_once(self) -> None:
+        """checks translations status of all tabs are resolved from translations of the form"""
+        jelly = Food.objects.get(pk=1)
+        edit_handler = Food.snippet_viewset.get_edit_handler()
+        form = edit_handler.get_form_class()(instance=jelly, for_user=None)
+        # translations loaded by the form are reused
+        with self.assertNumQueries(0):
+            bound_panel = edit_handler.get_bound_panel(instance=jelly, request=None, form=form)
+            headings = [child.heading for child in bound_panel.children]
+        self.assertEqual(
+            headings, ["Untranslated data", "🇫🇷 Français 🟢", "🇬🇧 Anglais 🟢", "🇪🇸 Espagnol 🔴"]
+        )
+        # without form (read only panels), all tabs share one query
+        jelly = Food.objects.get(pk=1)
+        with self.assertNumQueries(1):
+            bound_panel = edit_handler.get_bound_panel(instance=jelly, request=None, form=None)
+            self.assertEqual([child.heading for child in bound_panel.children], headings)
+
+    def test_translations_status_of_draft(self) -> None:
+        """checks translations status use unsaved translations and translations to delete"""
+        jelly = Food.objects.get(pk=1)
+        jelly.set_current_language("es")
+        jelly.name = "Gelatina"
+        jelly._translations_cache[Food._parler_meta.root_model]["en"] = TO_DELETE
+        self.assertEqual(get_translated_languages(jelly), {"fr", "es"})
+        jelly = Food.objects.get(pk=1)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_translated_languages(jelly), {"fr", "en"})
+        # translations loaded by the form are not queried again
+        jelly = Food.objects.get(pk=1)
+        load_translations(jelly)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_translated_languages(jelly), {"fr", "en"})
+
+    def test_headings_are_bound_per_request(self) -> None:
+        """checks headings are computed on bound panels and the shared handler stays untouched"""
+        edit_handler = Food.snippet_viewset.get_edit_handler()
+        form_class = edit_handler.get_form_class()
+        unbound_headings = [child.heading for child in edit_handler.children]
+        jelly = Food.objects.get(pk=1)
+        new_food = Food()
+        bound_jelly = edit_handler.get_bound_panel(
+            instance=jelly, request=None, form=form_class(instance=jelly, for_user=None)
+        )
+        bound_new_food = edit_handler.get_bound_panel(
+            instance=new_food, request=None, form=form_class(instance=new_food, for_user=None)
+        )
+        self.assertEqual(
+            [child.heading for child in bound_jelly.children],
+            ["Untranslated data", "French 🟢", "English 🟢", "Spanish 🔴"],
+        )
+        self.assertEqual(
+            [child.heading for child in bound_new_food.children],
+            ["Untranslated data", "French", "English", "Spanish"],
+        )
+        self.assertEqual([child.heading for child in edit_handler.children], unbound_headings)
+
+    def test_localized_fieldnames_index(self) -> None:
+        """checks translated fields are indexed by locale when the form class is built"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        self.assertCountEqual(
+            form_class.get_localized_fieldnames("en"),
+            [
+                ("name", "translations_en_name"),
+                ("summary", "translations_en_summary"),
+                ("qa", "translations_en_qa"),
+                ("content", "translations_en_content"),
+            ],
+        )
+        self.assertIsNot(
+            form_class.base_fields["translations_fr_name"],
+            form_class.base_fields["translations_en_name"],
+        )
+
+    def test_localized_fields_prototypes(self) -> None:
+        """checks fields of others locales are optional and labelled when the class is built"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        fr_field = form_class.base_fields["translations_fr_name"]
+        en_field = form_class.base_fields["translations_en_name"]
+        self.assertTrue(fr_field.required)
+        self.assertFalse(en_field.required)
+        self.assertFalse(en_field.widget.is_required)
+        self.assertEqual(en_field.label, "%s (EN)" % fr_field.label)
+        # labels are translated in the language of each request
+        self.assertIsInstance(en_field.label, Promise)
+        form = form_class()
+        form_class()
+        self.assertEqual(form.fields["translations_en_name"].label, en_field.label)
+        self.assertTrue(form.fields["translations_fr_name"].required)
+
+    def test_form_loads_translations_with_one_query(self) -> None:
+        """checks initials of all languages are populated with only one translations query"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        food = Food.objects.filter(translations__language_code="en").first()
+        with self.assertNumQueries(1):
+            form = form_class(instance=food)
+            self.assertFalse(food.has_translation("es"))
+            self.assertEqual(food.get_translation("en").name, form.initial["translations_en_name"])
+        self.assertNotIn("translations_es_name", form.initial)
+
+    def test_form_saves_translations_in_bulk(self) -> None:
+        """checks translations are created, updated and deleted with one query each"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        food = Food.objects.filter(translations__language_code="en").first()
+        form = form_class(instance=food)
+        form.edited_locales = ["fr", "en", "es"]
+        form.cleaned_data_for_locales = {
+            "fr": {"name": "Pomme"},
+            "en": {"name": "", "summary": ""},
+            "es": {"name": "Manzana"},
+        }
+        with self._own_translated_fields(Food), CaptureQueriesContext(connection) as queries:
+            form._save_locales()
+            self.assertFalse(food.has_translation("en"))
+            self.assertEqual(food.get_translation("es").name, "Manzana")
+        # others queries come from the parler cache (database cache backend)
+        table = Food._parler_meta.root_model._meta.db_table
+        self.assertEqual(len([q for q in queries if table in q["sql"]]), 3)
+        food = Food.objects.get(pk=food.pk)
+        self.assertEqual(sorted(food.get_available_languages()), ["es", "fr"])
+        self.assertEqual(food.get_translation("fr").name, "Pomme")
+        self.assertEqual(food.get_translation("es").name, "Manzana")
+
+        # translations of a new instance are created without querying them first
+        data = {**GELY_DATA[None], **GELY_DATA["fr"], **GELY_DATA["en"], **GELY_DATA["es"]}
+        form = form_class(data=data, instance=Food())
+        self.assertTrue(form.is_valid())
+        with self._own_translated_fields(Food), CaptureQueriesContext(connection) as queries:
+            food = form.save()
+        self.assertEqual([q["sql"][:6] for q in queries if table in q["sql"]], ["INSERT"])
+        food = Food.objects.get(pk=food.pk)
+        self.assertEqual(sorted(food.get_available_languages()), ["en", "es", "fr"])
+
+    def test_form_saves_translations_in_bulk_with_pre_save(self) -> None:
+        """checks values set by pre_save of fields (auto_now…) are saved with bulk updates"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        food = Food.objects.filter(translations__language_code="en").first()
+        form = form_class(instance=food)
+        form.edited_locales = ["en"]
+        form.cleaned_data_for_locales = {"en": {"name": "Apple"}}
+        summary_field = Food._parler_meta.root_model._meta.get_field("summary")
+        with self._own_translated_fields(Food):
+            with mock.patch.object(summary_field, "pre_save", return_value="Stamped"):
+                form._save_locales()
+        food = Food.objects.get(pk=food.pk)
+        self.assertEqual(food.get_translation("en").name, "Apple")
+        self.assertEqual(food.get_translation("en").summary, "Stamped")
+
+    def test_form_saves_translations_of_shared_fields(self) -> None:
+        """checks translations with fields shared by several models are saved in their table"""
+        i18n_model = Food._parler_meta.root_model
+        self.assertIsNot(i18n_model._meta.get_field("name").model, i18n_model)
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        food = Food.objects.filter(translations__language_code="en").first()
+        form = form_class(instance=food)
+        form.edited_locales = ["fr", "en", "es"]
+        form.cleaned_data_for_locales = {
+            "fr": {"name": "Pomme"},
+            "en": {"name": "Apple"},
+            "es": {"name": "Manzana"},
+        }
+        form._save_locales()
+        translations = i18n_model.objects.filter(master=food)
+        self.assertEqual(
+            {translation.language_code: translation.name for translation in translations},
+            {"fr": "Pomme", "en": "Apple", "es": "Manzana"},
+        )
+
+    def test_form_saves_changed_locales_only(self) -> None:
+        """checks translations of unchanged locales are not written"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        food = Food.objects.filter(translations__language_code="en").first()
+        form = form_class(instance=food)
+        form.cleaned_data_for_locales = {
+            locale: {
+                field_name: form.initial.get(i18n_field_name)
+                for field_name, i18n_field_name in form.get_localized_fieldnames(locale)
+            }
+            for locale in form.edited_locales
+        }
+        self.assertEqual(form.changed_locales, [])
+        del form.changed_locales
+        form.cleaned_data_for_locales["en"]["name"] = "Apple"
+        self.assertEqual(form.changed_locales, ["en"])
+        with CaptureQueriesContext(connection) as queries:
+            form._save_locales()
+        table = Food._parler_meta.root_model._meta.db_table
+        self.assertEqual(len([q for q in queries if table in q["sql"]]), 1)
+        self.assertEqual(Food.objects.get(pk=food.pk).get_translation("en").name, "Apple")
+
+    def test_emptiness_detectors(self) -> None:
+        """checks translations are empty if their values are empty for their detectors"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        self.assertIs(form_class.parler_emptiness_detectors["name"], is_empty_text)
+        self.assertIs(form_class.parler_emptiness_detectors["qa"], is_empty_stream)
+        form = form_class()
+        form.cleaned_data_for_locales = {
+            "fr": {"name": "Pomme", "summary": " ", "qa": []},
+            "en": {"name": " ", "summary": "", "qa": []},
+        }
+        self.assertFalse(form.is_locale_empty("fr"))
+        self.assertTrue(form.is_locale_empty("en"))
+        self.assertTrue(form.is_locale_empty("es"))
+
+        register_emptiness_detector(Textarea, lambda value: value == "-")
+        try:
+            form_class = build_translations_form(Food)
+        finally:
+            del EMPTINESS_DETECTORS[Textarea]
+        form = form_class()
+        form.cleaned_data_for_locales = {"fr": {"name": "", "summary": "-"}}
+        self.assertTrue(form.is_locale_empty("fr"))
+        # detectors do not change cleaned values…
+        form.cleaned_data = {"translations_fr_name": "", "translations_fr_summary": "-"}
+        form.clean()
+        self.assertEqual(form.cleaned_data_for_locales["fr"], {"name": "", "summary": "-"})
+        # … but the default empty <p> tag of rich texts
+        empty_rich_text = '<p data-block-key="a1b2c"></p>'
+        form.cleaned_data = {
+            "translations_fr_summary": empty_rich_text,
+            "translations_fr_content": "<p>%s</p>" % empty_rich_text,
+        }
+        with mock.patch.dict(
+            form.parler_emptiness_detectors,
+            {"summary": is_empty_rich_text, "content": is_empty_rich_text},
+        ):
+            form.clean()
+        self.assertEqual(
+            form.cleaned_data_for_locales["fr"],
+            {"summary": "", "content": "<p>%s</p>" % empty_rich_text},
+        )
+
+    def test_serializable_data_loads_translations_with_one_query(self) -> None:
+        """checks revisions data of all languages are serialized with one translations query"""
+        food = Food.objects.get(pk=1)
+        food.name = "Gelée modifiée"  # unsaved changes are serialized
+        with CaptureQueriesContext(connection) as queries:
+            data = food.serializable_data()
+        table = Food._parler_meta.root_model._meta.db_table
+        self.assertEqual(len([q for q in queries if table in q["sql"]]), 1)
+        self.assertEqual(set(data["translations"]), {"fr", "en"})
+        self.assertEqual(data["translations"]["fr"]["name"], "Gelée modifiée")
+        self.assertEqual(data["translations"]["en"]["name"], "Jelly")
+
+    def test_delta_revisions(self) -> None:
+        """checks revisions store changed locales only and are restored transparently"""
+        with mock.patch.multiple(
+            Food, parler_delta_revisions=True, parler_revisions_snapshot_interval=3
+        ):
+            jelly = Food.objects.get(pk=1)
+            jelly.save_revision()
+            jelly.set_current_language("en")
+            jelly.name = "Jelly updated"
+            jelly.save_revision()
+            jelly.name = "Jelly updated again"
+            jelly.save_revision()
+            jelly.save_revision()
+            first, second, third, snapshot = jelly.revisions.order_by("pk")
+            self.assertEqual(set(first.content["translations"]), {"fr", "en"})
+            self.assertEqual(set(second.content["translations"]), {"en"})
+            self.assertEqual(second.content["wagtail_parler_translations_refs"], {"fr": first.pk})
+            # references point to the revision storing the translation
+            self.assertEqual(third.content["wagtail_parler_translations_refs"], {"fr": first.pk})
+            self.assertEqual(third.content["wagtail_parler_delta_depth"], 2)
+            # snapshot interval is reached: all translations are stored
+            self.assertEqual(set(snapshot.content["translations"]), {"fr", "en"})
+            self.assertEqual(snapshot.content["wagtail_parler_translations_refs"], {})
+
+            with CaptureQueriesContext(connection) as queries:
+                restored = third.as_object()
+            # referenced revisions are loaded with one query
+            self.assertEqual(len([q for q in queries if '_revision"."id" IN' in q["sql"]]), 1)
+            self.assertEqual(restored.get_translation("fr").name, "Gelée")
+            self.assertEqual(restored.get_translation("en").name, "Jelly updated again")
+            restored.save()
+            jelly = Food.objects.get(pk=1)
+            self.assertEqual(set(jelly.get_available_languages()), {"fr", "en"})
+            self.assertEqual(jelly.get_translation("en").name, "Jelly updated again")
+
+            # translations of purged revisions are copied into the revisions referencing them
+            jelly.set_current_language("fr")
+            jelly.name = "Gelée modifiée"
+            jelly.save()
+            first.delete()
+            third.refresh_from_db()
+            self.assertEqual(set(third.content["translations"]), {"fr", "en"})
+            self.assertEqual(third.content["wagtail_parler_translations_refs"], {})
+            restored = third.as_object()
+            restored.save()
+            jelly = Food.objects.get(pk=1)
+            self.assertEqual(jelly.get_translation("fr").name, "Gelée")
+            # references which can not be resolved are reported
+            data = {**second.content, "wagtail_parler_translations_refs": {"fr": 0}}
+            with self.assertLogs("wagtail_parler.models", "WARNING"):
+                Food.from_serializable_data(data)
+
+    def test_delete_delta_revisions(self) -> None:
+        """checks revisions deleted together are not updated with the translations they store"""
+        with mock.patch.object(Food, "parler_delta_revisions", True):
+            jelly = Food.objects.get(pk=1)
+            jelly.save_revision()
+            jelly.set_current_language("en")
+            for name in ("Jelly updated", "Jelly updated again"):
+                jelly.name = name
+                jelly.save_revision()
+        first, second, third = jelly.revisions.order_by("pk")
+        with CaptureQueriesContext(connection) as queries:
+            jelly.revisions.filter(pk__in=[first.pk, second.pk]).delete()
+        table = Revision._meta.db_table
+        updates = [q for q in queries if q["sql"].startswith('UPDATE "%s"' % table)]
+        # only the kept revision is updated
+        self.assertEqual(len(updates), 1)
+        third.refresh_from_db()
+        self.assertEqual(third.content["wagtail_parler_translations_refs"], {})
+        self.assertEqual(third.as_object().get_translation("fr").name, "Gelée")
+        # revisions deleted with their object are left as they are
+        jelly = Food.objects.get(pk=1)
+        with mock.patch.object(Food, "parler_delta_revisions", True):
+            jelly.set_current_language("en")
+            jelly.name = "Jelly updated once more"
+            jelly.save_revision()
+        fourth = jelly.revisions.order_by("pk").last()
+        self.assertEqual(fourth.content["wagtail_parler_translations_refs"], {"fr": third.pk})
+        with self.assertNumQueries(0):
+            store_referenced_translations(Revision, instance=third, origin=jelly)
+        with CaptureQueriesContext(connection) as queries:
+            jelly.delete()
+        self.assertFalse([q for q in queries if q["sql"].startswith('UPDATE "%s"' % table)])
+
+    def test_compressed_revisions(self) -> None:
+        """checks translations of revisions are compressed and restored transparently"""
+        jelly = Food.objects.get(pk=1)
+        with mock.patch.object(Food, "parler_delta_revisions", True):
+            jelly.save_revision()  # revision saved before compression was enabled
+            with mock.patch.object(Food, "parler_compress_revisions", True):
+                jelly.set_current_language("en")
+                jelly.name = "Jelly updated"
+                jelly.save_revision()
+                jelly.save_revision()
+                uncompressed, compressed, unchanged = jelly.revisions.order_by("pk")
+                self.assertTrue(compressed.content["translations"].startswith("zlib:"))
+                self.assertEqual(
+                    unchanged.content["wagtail_parler_translations_refs"],
+                    {"fr": uncompressed.pk, "en": compressed.pk},
+                )
+                for revision, name in ((uncompressed, "Jelly"), (unchanged, "Jelly updated")):
+                    restored = revision.as_object()
+                    self.assertEqual(restored.get_translation("fr").name, "Gelée")
+                    self.assertEqual(restored.get_translation("en").name, name)
+                # translations copied from a deleted revision are compressed too
+                uncompressed.delete()
+                unchanged.refresh_from_db()
+                self.assertTrue(unchanged.content["translations"].startswith("zlib:"))
+                self.assertEqual(
+                    unchanged.content["wagtail_parler_translations_refs"], {"en": compressed.pk}
+                )
+                self.assertEqual(unchanged.as_object().get_translation("fr").name, "Gelée")
+
+    def test_revisions_changes(self) -> None:
+        """checks changed languages and fields are stored in revisions and queryable"""
+        jelly = Food.objects.get(pk=1)
+        with mock.patch.object(Food, "parler_revisions_changes", True):
+            jelly.save_revision()
+            jelly.set_current_language("en")
+            jelly.name = "Jelly updated"
+            jelly.save_revision()
+            jelly.delete_translation("en")
+            jelly.set_current_language("es")
+            jelly.name = "Gelatina"
+            jelly.save_revision()
+        first, second, third = jelly.revisions.order_by("pk")
+        self.assertEqual(
+            get_revisions_changes(jelly.revisions.all()),
+            {
+                first.pk: {
+                    "en": {"change": "added", "fields": ["name", "summary", "content", "qa"]},
+                    "fr": {"change": "added", "fields": ["name", "summary", "content", "qa"]},
+                },
+                second.pk: {"en": {"change": "modified", "fields": ["name"]}},
+                third.pk: {
+                    "en": {"change": "removed", "fields": ["name", "summary", "content", "qa"]},
+                    "es": {"change": "added", "fields": ["name"]},
+                },
+            },
+        )
+        self.assertEqual(
+            list(filter_revisions_by_locale(jelly.revisions.order_by("pk"), "en")),
+            [first, second, third],
+        )
+        self.assertEqual(list(filter_revisions_by_locale(jelly.revisions.all(), "es")), [third])
+
+    def test_publish_revision_deletes_translations_with_one_query(self) -> None:
+        """checks translations dropped by a revision are deleted with one query"""
+        jelly = Food.objects.get(pk=1)
+        jelly.set_current_language("es")
+        jelly.name = "Gelatina"
+        jelly.save()
+        jelly.set_current_language("fr")
+        data = jelly.serializable_data()
+        data["translations"] = {"fr": data["translations"]["fr"]}
+        restored = Food.from_serializable_data(data)
+        table = Food._parler_meta.root_model._meta.db_table
+        # deletions do not depend on the bulk insert capability of the database
+        with CaptureQueriesContext(connection) as queries, mock.patch.object(
+            type(connection.features), "can_return_rows_from_bulk_insert", False
+        ):
+            restored.save()
+        deletes = [q for q in queries if q["sql"].startswith("DELETE") and table in q["sql"]]
+        self.assertEqual(len(deletes), 1)
+        self.assertFalse(restored.has_translation("en"))
+        self.assertFalse(restored.has_translation("es"))
+        jelly = Food.objects.get(pk=1)
+        self.assertEqual(list(jelly.get_available_languages()), ["fr"])
+        self.assertFalse(jelly.has_translation("es"))
+
+    def test_publish_revision_deletes_translations_one_by_one(self) -> None:
+        """checks translations which can't be deleted in bulk are deleted with their own method"""
+        jelly = Food.objects.get(pk=1)
+        data = jelly.serializable_data()
+        data["translations"] = {"fr": data["translations"]["fr"]}
+        restored = Food.from_serializable_data(data)
+        i18n_model = Food._parler_meta.root_model
+        with mock.patch(
+            "wagtail_parler.models.can_bulk_delete_translations", return_value=False
+        ), mock.patch.object(
+            i18n_model, "delete", autospec=True, side_effect=i18n_model.delete
+        ) as delete:
+            restored.save()
+        self.assertEqual([call.args[0].language_code for call in delete.call_args_list], ["en"])
+        jelly = Food.objects.get(pk=1)
+        self.assertEqual(list(jelly.get_available_languages()), ["fr"])
+
+    def test_can_bulk_delete_translations(self) -> None:
+        """checks translations are deleted in bulk unless their deletion is customized"""
+        i18n_model = Food._parler_meta.root_model
+        # translated fields are shared by all foods models
+        self.assertFalse(can_bulk_save_translations(i18n_model))
+        self.assertTrue(can_bulk_delete_translations(i18n_model))
+        with self._own_translated_fields(Food):
+            with mock.patch.object(
+                type(connection.features), "can_return_rows_from_bulk_insert", False
+            ):
+                self.assertFalse(can_bulk_save_translations(i18n_model))
+                self.assertTrue(can_bulk_delete_translations(i18n_model))
+            with mock.patch.object(i18n_model, "save", autospec=True, side_effect=i18n_model.save):
+                self.assertFalse(can_bulk_save_translations(i18n_model))
+                self.assertTrue(can_bulk_delete_translations(i18n_model))
+            with mock.patch.object(
+                i18n_model, "delete", autospec=True, side_effect=i18n_model.delete
+            ):
+                self.assertTrue(can_bulk_save_translations(i18n_model))
+                self.assertFalse(can_bulk_delete_translations(i18n_model))
+
+        def receiver(**kwargs: Dict) -> None:
+            pass
+
+        post_delete.connect(receiver, sender=i18n_model)
+        try:
+            self.assertFalse(can_bulk_delete_translations(i18n_model))
+        finally:
+            post_delete.disconnect(receiver, sender=i18n_model)
+        self.assertTrue(can_bulk_delete_translations(i18n_model))
+
+    def test_locales_form_classes_are_cached(self) -> None:
+        """checks form classes of a locales subset are built once"""
+        form_class = Food.snippet_viewset.get_edit_handler().get_form_class()
+        en_form_class = form_class.for_locales(["en"])
+        self.assertIs(form_class.for_locales(["en"]), en_form_class)
+        self.assertIs(form_class.for_locales(["fr", "en", "es"]), form_class)
+        self.assertEqual(en_form_class.parler_locales, ["fr", "en"])
+        self.assertIn("translations_en_name", en_form_class.base_fields)
+        self.assertNotIn("translations_es_name", en_form_class.base_fields)
+        # only the last used subclasses are kept
+        with mock.patch.object(form_class, "parler_locales_form_classes_size", 1):
+            es_form_class = form_class.for_locales(["es"])
+            self.assertEqual(len(form_class._locales_form_classes), 1)
+            self.assertIs(form_class.for_locales(["es"]), es_form_class)
+            self.assertIsNot(form_class.for_locales(["en"]), en_form_class)
+        # same for ModelAdmin views with a locales picker
+        admin = self._get_model_admin("foodwithemptyedithandler")
+        request = RequestFactory().get("/", {"wagtail_parler_locales": "en"})
+        request.user = AnonymousUser()
+        form_classes = []
+        for _i in range(2):
+            view = admin.create_view_class(model_admin=admin)
+            view.setup(request)
+            form_classes.append(view.get_form_class())
+        self.assertIs(form_classes[0], form_classes[1])
+        self.assertIs(form_classes[0], admin.get_parler_edit_form_class().for_locales(["en"]))
+
+    def test_translated_comparators_are_built_once(self) -> None:
+        """checks comparators of translated fields are reused between comparisons"""
+        edit_handler = Food.snippet_viewset.get_edit_handler()
+        jelly = Food.objects.get(pk=1)
+        comparators = edit_handler.get_bound_panel(instance=jelly).get_comparison()
+        self.assertEqual(
+            [str(comparator(jelly, jelly).field_label()) for comparator in comparators[-4:]],
+            ["Nom [es]", "Résumé [es]", "Contenu [es]", "Some QA [es]"],
+        )
+        new_comparators = edit_handler.get_bound_panel(instance=jelly).get_comparison()
+        # 4 translated fields for 3 languages
+        for comparator, new_comparator in zip(comparators[-12:], new_comparators[-12:]):
+            self.assertIs(comparator, new_comparator)
+
+    def test_revisions_comparison_without_queries(self) -> None:
+        """checks translated fields of revisions are compared from revisions data only"""
+        jelly = Food.objects.get(pk=1)
+        jelly.save_revision()
+        jelly.set_current_language("en")
+        jelly.name = "Jelly updated"
+        jelly.save_revision()
+        revision_a, revision_b = [rev.as_object() for rev in jelly.revisions.order_by("pk")]
+        revision_a.set_current_language("fr")
+        edit_handler = Food.snippet_viewset.get_edit_handler()
+        comparators = edit_handler.get_bound_panel(instance=jelly).get_comparison()
+        with self.assertNumQueries(0):
+            comparisons = [comparator(revision_a, revision_b) for comparator in comparators]
+            changes = [str(comp.field_label()) for comp in comparisons if comp.has_changed()]
+        self.assertEqual(changes, ["Nom [en]"])
+        # only the english translation changed: others locales are not compared
+        fully_compared = [
+            str(comp.field_label())
+            for comp in comparisons[-12:]
+            if not isinstance(comp, UnchangedFieldComparison)
+        ]
+        self.assertEqual(
+            fully_compared, ["Nom [en]", "Résumé [en]", "Contenu [en]", "Some QA [en]"]
+        )
+        self.assertEqual(revision_a.get_current_language(), "fr")
+        self.assertEqual((revision_a.pk, revision_b.pk), (1, 1))
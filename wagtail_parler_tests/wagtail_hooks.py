@@ -50,6 +50,16 @@ specific_edit_handler = ObjectList(
 )
 
 
+def get_translator_locales(user):
+    # translators may only edit their languages, ex: members of the "translators_en" group
+    locales = [
+        name.replace("translators_", "", 1)
+        for name in user.groups.values_list("name", flat=True)
+        if name.startswith("translators_")
+    ]
+    return locales or None
+
+
 class FoodAdmin(ParlerModelAdminMixin, ModelAdmin):
     model = Food
 
@@ -64,10 +74,13 @@ class FoodWithPanelsInsideModelAdmin(ParlerModelAdminMixin, ModelAdmin):
 
 class FoodWithEditHandlerAdmin(ParlerModelAdminMixin, ModelAdmin):
     model = FoodWithEditHandler
+    parler_lazy_tabs = True
+    parler_partial_submit = True
 
 
 class FoodWithEmptyEditHandlerAdmin(ParlerModelAdminMixin, ModelAdmin):
     model = FoodWithEmptyEditHandler
+    parler_locales_picker = True
     edit_handler = ObjectList(
         children=[
             FieldPanel("yum_rating"),
@@ -90,6 +103,9 @@ class FoodWithSpecificEditHandlerAdmin(ParlerModelAdminMixin, ModelAdmin):
     model = FoodWithSpecificEditHandler
     edit_handler = deepcopy(specific_edit_handler)
 
+    def get_parler_locales_for_user(self, user):
+        return get_translator_locales(user)
+
 
 class FoodWithInlinePanelAdmin(ParlerModelAdminMixin, ModelAdmin):
     model = FoodWithInlinePanel
@@ -107,6 +123,8 @@ modeladmin_register(FoodWithInlinePanelAdmin)
 # Now, same things but  for Snippets
 class FoodAdminSnippet(ParlerSnippetAdminMixin, SnippetViewSet):
     model = Food
+    parler_trim_preview_session = True
+    parler_compress_preview_session = True
 
 
 # Now, same things but  for Snippets
@@ -121,10 +139,13 @@ class FoodWithPanelsInsideModelAdminSnippet(ParlerSnippetAdminMixin, SnippetView
 
 class FoodWithEditHandlerAdminSnippet(ParlerSnippetAdminMixin, SnippetViewSet):
     model = FoodWithEditHandler
+    parler_lazy_tabs = True
+    parler_partial_submit = True
 
 
 class FoodWithEmptyEditHandlerAdminSnippet(ParlerSnippetAdminMixin, SnippetViewSet):
     model = FoodWithEmptyEditHandler
+    parler_locales_picker = True
     edit_handler = ObjectList(
         children=[
             FieldPanel("yum_rating"),
@@ -143,6 +164,9 @@ class FoodWithSpecificEditHandlerAdminSnippet(ParlerSnippetAdminMixin, SnippetVi
     model = FoodWithSpecificEditHandler
     edit_handler = deepcopy(specific_edit_handler)
 
+    def get_parler_locales_for_user(self, user):
+        return get_translator_locales(user)
+
 
 class FoodWithInlinePanelAdminSnippet(ParlerSnippetAdminMixin, SnippetViewSet):
     model = FoodWithInlinePanel